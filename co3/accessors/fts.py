@@ -1,3 +1,8 @@
+import json
+import sqlite3
+import weakref
+from functools import lru_cache
+
 import sqlalchemy as sa
 
 from co3 import util
@@ -5,6 +10,133 @@ from co3.accessor import Accessor
 from co3.accessors.sql import SQLAccessor
 
 
+# highlight markers wrapped around matched terms in snippets and highlights
+_HL_START = '<b><mark>'
+_HL_END   = '</mark></b>'
+
+
+@lru_cache(maxsize=256)
+def _build_select_stmt(
+    fts_table_name : str,
+    select_cols    : str,
+    snip_col       : int,
+    hl_col         : int,
+    has_query      : bool,
+    wherein_cols   : tuple[tuple[str, int], ...],
+    group_by       : str | None = None,
+    agg_cols       : tuple[str, ...] = (),
+):
+    '''
+    Build the parameterized FTS search statement for a given query "shape." Everything
+    that varies across calls with the same shape (query text, highlight markers, snippet
+    length, limit, and ``IN`` values) is left to bound parameters, so the same SQL
+    string (and ``sqlite3``'s prepared statement for it) is reused on repeat searches.
+    ``wherein_cols`` holds ``(column, value count)`` pairs, with one ``:wi_<i>_<j>``
+    parameter bound per value; statements are shared across calls filtering on the same
+    number of values.
+
+    .. admonition:: Separating MATCH from column filters
+
+        SQLite's planner can abandon the FTS5 index when ``MATCH`` is ANDed with
+        constraints on other columns, degrading to a scan that is orders of magnitude
+        slower on large tables. When both a query and ``wherein_cols`` are provided, the
+        ``MATCH`` is instead isolated in a CTE that ranks and over-fetches
+        (``:overfetch`` rows), and the ``IN`` filters are applied to that materialized
+        set by rowid. Note this means filtered results are drawn from the top
+        ``:overfetch`` matches only.
+
+        Ordering stays on FTS5's ``rank`` column (BM25 by default) rather than an explicit
+        ``bm25()`` call, as FTS5 can satisfy ``ORDER BY rank LIMIT n`` without scoring and
+        sorting every match. The score is returned as ``rank`` for any search with a
+        query, so callers can re-order or merge results without re-scoring.
+
+    When ``group_by`` is provided, the search statement is wrapped as a subquery over the
+    top ``:overfetch`` rows and grouped in the outer ``SELECT``. Each group is represented
+    by its best-ranked row (SQLite takes bare columns from the row matching ``MIN()``),
+    and each of ``agg_cols`` is collected as ``json_group_array(DISTINCT <col>)`` under
+    ``<col>_agg``. Groups are ordered by ``group_rank`` and limited by ``:limit``.
+    '''
+    snippet_sql   = f"snippet({fts_table_name}, {snip_col}, :hl_start, :hl_end, '...', :snip)"
+    highlight_sql = f'highlight({fts_table_name}, {hl_col}, :hl_start, :hl_end)'
+
+    # one plain ``:wi_<i>_<j>`` bind per value (not an expanding bindparam, as the
+    # statement runs on the raw sqlite3 cursor); each distinct value count per column
+    # gives its own cached statement
+    wherein_clauses = [
+        f'{fts_table_name}.{col} IN ({", ".join(f":wi_{i}_{j}" for j in range(n))})'
+        for i, (col, n) in enumerate(wherein_cols)
+    ]
+
+    # expose match scores to callers; grouped searches also rank groups by their best
+    # row, so they always fetch rank and over-fetch rows
+    rank_sql  = ''
+    row_limit = ':limit'
+    if has_query or group_by is not None:
+        rank_sql  = ',\n            rank'
+    if group_by is not None:
+        row_limit = ':overfetch'
+
+    if has_query and wherein_clauses:
+        rank_sql = ',\n            fts_matches.rank'
+
+        if select_cols.strip() == '*':
+            select_cols = f'{fts_table_name}.*'
+
+        sql = f'''
+        WITH fts_matches AS (
+            SELECT
+                rowid,
+                rank,
+                {snippet_sql} AS snippet,
+                {highlight_sql} AS highlight
+            FROM {fts_table_name}
+            WHERE {fts_table_name} MATCH :query
+            ORDER BY rank LIMIT :overfetch
+        )
+        SELECT
+            {select_cols},
+            fts_matches.snippet,
+            fts_matches.highlight{rank_sql}
+        FROM fts_matches
+        JOIN {fts_table_name} ON {fts_table_name}.rowid = fts_matches.rowid
+        WHERE {" AND ".join(wherein_clauses)}
+        ORDER BY fts_matches.rank LIMIT {row_limit}
+        '''
+    else:
+        sql = f'''
+        SELECT
+            {select_cols},
+            {snippet_sql} AS snippet,
+            {highlight_sql} AS highlight{rank_sql}
+        FROM {fts_table_name}
+        '''
+
+        where_clauses = wherein_clauses
+        if has_query:
+            where_clauses = [f'{fts_table_name} MATCH :query']
+
+        if where_clauses:
+            sql += f'WHERE {" AND ".join(where_clauses)}\n'
+
+        sql += f'ORDER BY rank LIMIT {row_limit}'
+
+    if group_by is not None:
+        agg_sql = ''.join(
+            f',\n            json_group_array(DISTINCT {col}) AS {col}_agg'
+            for col in agg_cols
+        )
+        sql = f'''
+        SELECT
+            *{agg_sql},
+            MIN(rank) AS group_rank
+        FROM ({sql})
+        GROUP BY {group_by}
+        ORDER BY group_rank LIMIT :limit
+        '''
+
+    return sql
+
+
 class FTSAccessor(Accessor):
     '''
     Perform queries on efficient full-text search (FTS) tables.
@@ -18,7 +150,54 @@ class FTSAccessor(Accessor):
     '''
     def __init__(self):
         self.sql_accessor = SQLAccessor()
-        self.access_log   = sql_accessor.access_log
+        self.access_log   = self.sql_accessor.access_log
+
+        # engine -> names of FTS tables verified on it; entries go with their engine
+        self._verified_tables = weakref.WeakKeyDictionary()
+
+    def raw_select(
+        self,
+        connection,
+        sql,
+        bind_params=None,
+        mappings=False,
+        include_cols=False,
+    ):
+        '''
+        Execute a raw SQL query against FTS tables; see ``SQLAccessor.raw_select``.
+        '''
+        return self.sql_accessor.raw_select(
+            connection,
+            sql,
+            bind_params=bind_params,
+            mappings=mappings,
+            include_cols=include_cols,
+        )
+
+    def _verify_table(self, connection, fts_table_name: str):
+        '''
+        Check that an FTS table exists before its first search on a given engine, so a
+        missing table (or tokenizer) surfaces as a clear error instead of an opaque SQL
+        failure. Verified tables are remembered per engine (held weakly, so disposed
+        engines drop out), and later searches skip the check; see ``_forget_table``.
+        '''
+        verified = self._verified_tables.get(connection.engine)
+        if verified is not None and fts_table_name in verified:
+            return
+
+        if not sa.inspect(connection).has_table(fts_table_name):
+            raise ValueError(f'FTS table "{fts_table_name}" does not exist')
+
+        self._verified_tables.setdefault(connection.engine, set()).add(fts_table_name)
+
+    def _forget_table(self, connection, fts_table_name: str):
+        '''
+        Drop a table from the verified set, e.g., after a search against it fails, so a
+        table dropped since its verification is checked (and reported) again.
+        '''
+        verified = self._verified_tables.get(connection.engine)
+        if verified is not None:
+            verified.discard(fts_table_name)
 
     def select(
         self,
@@ -33,6 +212,9 @@ class FTSAccessor(Accessor):
         limit       : int | None        = 100,
         snip        : int | None        = 64,
         tokenizer   : str | None        = 'unicode61',
+        wherein_dict: dict | None       = None,
+        group_by    : str | None        = None,
+        agg_cols    : list | None       = None,
     ):
         '''
         Execute a search query against an indexed FTS table for specific primitives. This
@@ -41,7 +223,8 @@ class FTSAccessor(Accessor):
         intention is support all tokenizers, for file, note, block, and link primitives.
 
         Search results include all FTS table columns, as well as SQLite-supported ``snippet``s
-        and ``highlight``s for matches. Matches are filtered and ordered by SQLite's
+        and ``highlight``s for matches, and the BM25 ``rank`` score (lower is better) when
+        a query is provided. Matches are filtered and ordered by SQLite's
         ``MATCH``-based score for the text & column queries. Results are (a list of) fully
         expanded dictionaries housing column-value pairs.
 
@@ -54,9 +237,18 @@ class FTSAccessor(Accessor):
             snip_col    : table column to use for snippets (default: 1; source content column)
             hl_col      : table column to use for highlights (default: 2; format column, applied
                           to HTML targets)
-            limit       : maximum number of results to return in the SQL query
+            limit       : maximum number of results to return in the SQL query (``None``
+                          for no limit)
             snip        : snippet length (max: 64)
             tokenizer   : tokenizer to use (assumes relevant FTS table has been built)
+            wherein_dict: optional column-indexed dict of allowed values, each restricting
+                          results with a ``<col> IN (...)`` constraint. Each value is bound
+                          as its own parameter, never interpolated into the query string.
+            group_by    : optional column to group results by in SQL; each group is
+                          represented by its best-ranked row, and ``limit`` then applies
+                          to groups (drawn from the top ``10*limit`` matching rows)
+            agg_cols    : columns whose distinct values are collected per group, returned
+                          as lists under ``<col>_agg`` (requires ``group_by``)
 
         Returns:
             Dictionary with search results (list of column indexed dictionaries) and relevant
@@ -77,33 +269,61 @@ class FTSAccessor(Accessor):
 
         search_query = search_query.strip()
 
-        hl_start = '<b><mark>'
-        hl_end   = '</mark></b>'
+        if wherein_dict is None:
+            wherein_dict = {}
 
         fts_table_name = f'{table_name}_fts_{tokenizer}'
-        
-        sql = f'''
-        SELECT
-            {select_cols},
-            snippet({fts_table_name}, {snip_col}, '{hl_start}', '{hl_end}', '...', {snip}) AS snippet,
-            highlight({fts_table_name}, {hl_col}, '{hl_start}', '{hl_end}') AS highlight 
-        FROM {fts_table_name}
-        '''
-        
-        where_clauses = []
+        self._verify_table(connection, fts_table_name)
+
+        wherein_vals = [list(vals) for vals in wherein_dict.values()]
+
+        statement = _build_select_stmt(
+            fts_table_name,
+            select_cols,
+            snip_col,
+            hl_col,
+            bool(search_query),
+            tuple(zip(wherein_dict.keys(), map(len, wherein_vals))),
+            group_by,
+            tuple(agg_cols or ()),
+        )
+
+        # SQLite treats a negative LIMIT as no limit
+        if limit is None:
+            limit = -1
+
+        bind_params = {
+            'hl_start' : _HL_START,
+            'hl_end'   : _HL_END,
+            'snip'     : snip,
+            'limit'    : limit,
+        }
         if search_query:
-            where_clauses.append(f"{fts_table_name} MATCH '{search_query}'\n")
+            bind_params['query'] = search_query
 
-        if wherein_dict:
-            for col, vals in wherein_dict.items():
-                where_clauses.append(f'{col} IN {tuple(vals)}\n')
+        # over-fetch factor for the MATCH-only CTE used when filters are present, and for
+        # the row set that grouped searches are drawn from
+        if (search_query and wherein_dict) or group_by is not None:
+            bind_params['overfetch'] = limit * 10 if limit > 0 else -1
 
-        if where_clauses:
-            where_str = " AND ".join(where_clauses)
-            sql += f'WHERE {where_str}'
+        for i, vals in enumerate(wherein_vals):
+            for j, val in enumerate(vals):
+                bind_params[f'wi_{i}_{j}'] = val
 
-        sql += f'ORDER BY rank LIMIT {limit};'
+        # FTS tables are SQLite-only; go straight to the sqlite3 cursor
+        try:
+            row_dicts, cols = self.sql_accessor.raw_select_dbapi(
+                connection,
+                statement,
+                bind_params=bind_params,
+            )
+        except sqlite3.OperationalError:
+            self._forget_table(connection, fts_table_name)
+            raise
 
-        row_dicts, cols = self.sql_accessor.raw_select(connection, sql, include_cols=True)
+        if group_by is not None:
+            for row in row_dicts:
+                for col in agg_cols or ():
+                    row[f'{col}_agg'] = json.loads(row[f'{col}_agg'])
 
         return row_dicts, cols
@@ -38,6 +38,7 @@
 '''
 import inspect
 from pathlib import Path
+from functools import lru_cache
 
 import sqlalchemy as sa
 
@@ -46,6 +47,30 @@ from co3.accessor import Accessor
 from co3.components import Relation, SQLTable
 
 
+@lru_cache(maxsize=256)
+def _select_statement(table, columns: tuple | None = None):
+    '''
+    Base SELECT for a table-like object and an optional column subset. Statement methods
+    are generative, so clauses added per call (WHERE, ORDER BY, etc) never modify the
+    cached base; repeated selects against the same table/column shape skip rebuilding
+    it.
+    '''
+    if columns is None:
+        return sa.select(table)
+
+    return sa.select(*columns).select_from(table)
+
+
+@lru_cache(maxsize=1024)
+def _text_clause(sql: str):
+    '''
+    ``TextClause`` for a raw SQL string. Reusing the same clause object for repeat
+    strings skips re-parsing its bind parameters and gives SQLAlchemy's compiled cache a
+    stable statement to hit.
+    '''
+    return sa.text(sql)
+
+
 class RelationalAccessor[R: Relation](Accessor[R]):
     @staticmethod
     def raw_select(
@@ -79,7 +104,13 @@ class RelationalAccessor[R: Relation](Accessor[R]):
         include_cols : bool = False,
     ):
         res = self.select(
-            relation, attributes, where, mappings, include_cols, limit=1
+            connection,
+            relation,
+            attributes,
+            where,
+            limit=1,
+            mappings=mappings,
+            include_cols=include_cols,
         )
 
         if include_cols and len(res[0]) > 0:
@@ -95,23 +126,59 @@ class SQLAccessor(RelationalAccessor[SQLTable]):
     def raw_select(
         self,
         connection,
-        sql: str,
+        sql: str | sa.TextClause,
         bind_params=None,
         mappings=False,
         include_cols=False,
+        stream: int = 0,
     ):
+        '''
+        Execute a raw SQL query. ``sql`` can be a string or a pre-built ``TextClause``;
+        the latter allows callers to hold onto a single parameterized clause across calls
+        (with varying ``bind_params``) and hit SQLAlchemy's compiled statement cache.
+
+        See ``select`` for the ``stream`` parameter.
+        '''
+        if isinstance(sql, str):
+            sql = _text_clause(sql)
+
         res = SQLEngine.execute(
             connection,
-            sa.text(sql),
+            sql,
             bind_params=bind_params,
-            include_cols=include_cols
+            execution_options={'yield_per': stream} if stream else None,
         )
         self.log_access(sql)
 
-        if mappings:
-            return res.mappings().all()
-        else:
-            return self.result_dicts(res)
+        return self._format_results(res, mappings, include_cols, stream)
+
+    def raw_select_dbapi(
+        self,
+        connection,
+        sql: str,
+        bind_params=None,
+    ):
+        '''
+        Execute a raw SQL string directly on the DBAPI cursor underlying ``connection``,
+        skipping SQLAlchemy's statement dispatch and per-row ``Row`` construction. Meant
+        for hot, fixed-shape read queries. ``bind_params`` must use the driver's native
+        paramstyle (e.g., ``:name`` for ``sqlite3``); no SQLAlchemy-level parameter
+        processing (like ``expanding`` lists) is applied.
+
+        Returns:
+            Tuple of (list of column-indexed dictionaries, list of column names)
+        '''
+        cursor = connection.connection.cursor()
+        try:
+            cursor.execute(sql, bind_params or {})
+            keys = [desc[0] for desc in cursor.description]
+            rows = [dict(zip(keys, row)) for row in cursor.fetchall()]
+        finally:
+            cursor.close()
+
+        self.log_access(sql)
+
+        return rows, keys
 
     def select(
         self,
@@ -124,6 +191,7 @@ class SQLAccessor(RelationalAccessor[SQLTable]):
         limit        = 0,
         mappings     = False,
         include_cols = False,
+        stream: int  = 0,
     ): # -> list[dict|sa.Mapping]: (double check the Mapping types)
         '''
         Perform a SELECT query against the provided table-like object (see
@@ -139,18 +207,22 @@ class SQLAccessor(RelationalAccessor[SQLTable]):
                       (no aggregation methods accepted)
             order_by: column to order results by (can use <col>.desc() to order
                       by descending)
+            stream:   if non-zero, fetch rows in chunks of this size (``yield_per``) and
+                      return a generator rather than a list. Only ``stream`` rows are
+                      buffered at a time, but the provided connection must remain open
+                      while the generator is consumed.
 
         Returns:
-            Statement results, either as a list of 1) SQLAlchemy Mappings, or 2) converted
-            dictionaries
+            Statement results, either as a list (or generator, if streaming) of 1)
+            SQLAlchemy Mappings, or 2) converted dictionaries
         '''
-        if where is None:
-            where = sa.true()
-
-        table = component.obj
-        statement = sa.select(table).where(where)
         if columns is not None:
-            statement = sa.select(*columns).select_from(table).where(where)
+            columns = tuple(columns)
+
+        statement = _select_statement(component.obj, columns)
+
+        if where is not None:
+            statement = statement.where(where)
 
         if distinct_on is not None:
             statement = statement.group_by(distinct_on)
@@ -161,13 +233,70 @@ class SQLAccessor(RelationalAccessor[SQLTable]):
         if limit > 0:
             statement = statement.limit(limit)
 
-        res = SQLEngine.execute(connection, statement, include_cols=include_cols)
+        res = SQLEngine.execute(
+            connection,
+            statement,
+            execution_options={'yield_per': stream} if stream else None,
+        )
         self.log_access(statement)
 
+        return self._format_results(res, mappings, include_cols, stream)
+
+    def select_one(
+        self,
+        connection,
+        component    : SQLTable,
+        columns             = None,
+        where               = None,
+        mappings     : bool = False,
+        include_cols : bool = False,
+    ):
+        '''
+        Select a single row from the provided table-like object, or ``None`` if no rows
+        match. Rather than routing through ``select`` and slicing a materialized list, the
+        ``LIMIT 1`` statement's result is read with ``first()``, fetching only that row.
+        '''
+        if columns is not None:
+            columns = tuple(columns)
+
+        statement = _select_statement(component.obj, columns)
+
+        if where is not None:
+            statement = statement.where(where)
+
+        statement = statement.limit(1)
+
+        res = SQLEngine.execute(connection, statement)
+        self.log_access(statement)
+
+        cols = list(res.keys())
         if mappings:
-            return res.mappings().all()
+            row = res.mappings().first()
+        else:
+            row = res.first()
+            if row is not None:
+                row = dict(zip(cols, row))
+
+        if include_cols:
+            return row, cols
+
+        return row
+
+    def _format_results(self, results, mappings, include_cols, stream):
+        if stream:
+            if mappings:
+                rows = (m for p in results.mappings().partitions() for m in p)
+            else:
+                rows = self.stream_dicts(results)
+        elif mappings:
+            rows = results.mappings().all()
         else:
-            return self.result_dicts(res)
+            rows = self.result_dicts(results)
+
+        if include_cols:
+            return rows, list(results.keys())
+
+        return rows
 
     @staticmethod
     def result_dicts(results, query_cols=None):
@@ -190,13 +319,29 @@ class SQLAccessor(RelationalAccessor[SQLTable]):
             [..., {'col':<value>, 'col_1':<value>, ...}, ...]
 
         which can make accessing certain results a little more intuitive. 
-        '''
-        result_mappings = results.mappings().all()
 
+        In either case, rows are zipped directly against keys computed once up front,
+        skipping the intermediate ``RowMapping`` built for each row. With ``query_cols``,
+        ``Result.columns()`` resolves the column objects to row positions a single time.
+        '''
         if query_cols:
+            keys = tuple(str(c) for c in query_cols)
             return [
-                { str(c):r[c] for c in query_cols }
-                for r in result_mappings
+                dict(zip(keys, row))
+                for row in results.columns(*query_cols).fetchall()
             ]
 
-        return [dict(r) for r in result_mappings]
+        keys = tuple(results.keys())
+        return [dict(zip(keys, row)) for row in results.fetchall()]
+
+    @staticmethod
+    def stream_dicts(results):
+        '''
+        Lazily convert SQLAlchemy results into Python dicts, one result partition at a
+        time. Pairs with the ``yield_per`` execution option to keep memory bounded by the
+        partition size rather than the full result set.
+        '''
+        keys = tuple(results.keys())
+        for partition in results.partitions():
+            for row in partition:
+                yield dict(zip(keys, row))
@@ -75,14 +75,18 @@ Generic collation syntax:
     the latter integrates a bit better with the formal collation process, e.g., will
     throw ``ValueErrors`` based on key mismatches automatically.
 '''
-import inspect
+import sys
 import logging
+from types import FunctionType, MappingProxyType
 from collections import defaultdict
 from functools import wraps, partial
 
 
 logger = logging.getLogger(__name__)
 
+# sentinel for unset slot attributes
+_MISSING = object()
+
 def collate(key, groups=None):
     '''
     Collation decorator for CO3 subtype action registry.
@@ -183,7 +187,7 @@ def collate(key, groups=None):
             considered against explicitly registered keys.
     '''
     func = None
-    if inspect.isfunction(key):
+    if type(key) is FunctionType:
         func = key
         key = None
         groups = [func.__name__]
@@ -191,6 +195,12 @@ def collate(key, groups=None):
     if groups is None:
         groups = [None]
 
+    # intern key and group names so registry lookups with equal literals can match on
+    # identity; names built at runtime (e.g., formatted strings) aren't interned otherwise
+    if isinstance(key, str):
+        key = sys.intern(key)
+    groups = [sys.intern(g) if isinstance(g, str) else g for g in groups]
+
     def decorator(f):
         f._collation_data = (key, groups)
         return f
@@ -211,29 +221,70 @@ class FormatRegistryMeta(type):
         def register_action(method):
             nonlocal key_registry, group_registry
 
-            if hasattr(method, '_collation_data'):
-                key, groups = method._collation_data
+            if (collation_data := getattr(method, '_collation_data', None)) is not None:
+                key, groups = collation_data
                 for group in groups:
                     key_registry[key][group] = method
                     group_registry[group].add(key)
 
         # add registered superclass methods; iterate over bases (usually just one), then
-        # that base's chain down (reversed), then methods from each subclass
+        # that base's chain down (reversed), then methods defined directly on each class.
+        # Scanning each class's own namespace (rather than ``inspect.getmembers``, which
+        # resolves every visible attribute) registers the same methods in the same MRO
+        # order, with later classes overwriting earlier ones.
         for base in bases:
-            for _class in reversed(base.mro()):
-                methods = inspect.getmembers(_class, predicate=inspect.isfunction)
-                for _, method in methods:
-                    register_action(method)
+            # bases built by this metaclass already hold the merged registry for their
+            # full chain; pick it up rather than re-walking it
+            if isinstance(base, FormatRegistryMeta):
+                for key, group_methods in base.key_registry.items():
+                    key_registry[key].update(group_methods)
+                for group, keys in base.group_registry.items():
+                    group_registry[group].update(keys)
+                continue
+
+            for _class in reversed(base.__mro__):
+                for method in vars(_class).values():
+                    if type(method) is FunctionType:
+                        register_action(method)
 
         # add final registered formats for the current class, overwriting any found in
         # superclass chain
         for attr_name, attr_value in attrs.items():
             register_action(attr_value)
 
-        attrs['key_registry'] = key_registry
-        attrs['group_registry'] = group_registry
+        # registries are fixed once the class is built; freeze them so lookups can't
+        # mutate them (e.g., by creating missing keys on a defaultdict)
+        attrs['key_registry'] = MappingProxyType({
+            key: MappingProxyType(group_methods)
+            for key, group_methods in key_registry.items()
+        })
+        attrs['group_registry'] = MappingProxyType({
+            group: frozenset(keys)
+            for group, keys in group_registry.items()
+        })
+
+        # fix the slot names read by ``CO3.attributes`` across the class chain, minus the
+        # internal collation cache
+        attr_names = []
+        for base in bases:
+            attr_names.extend(getattr(base, '_attr_names', ()))
+
+        slots = attrs.get('__slots__', ())
+        if isinstance(slots, str):
+            slots = (slots,)
+
+        attr_names.extend(
+            slot for slot in slots
+            if slot not in ('__dict__', '__weakref__', '_collate_cache')
+        )
+        attrs['_attr_names'] = tuple(dict.fromkeys(attr_names))
+
+        new_cls = super().__new__(cls, name, bases, attrs)
+
+        # instances carry a ``__dict__`` unless every class in the chain is slotted
+        new_cls._instance_dict = new_cls.__dictoffset__ != 0
 
-        return super().__new__(cls, name, bases, attrs)
+        return new_cls
 
 class CO3(metaclass=FormatRegistryMeta):
     '''
@@ -262,6 +313,8 @@ class CO3(metaclass=FormatRegistryMeta):
         ``collate_cache`` parameter has been added to store key-group indexed collation
         results. (Note: now requires explicit superclass instantiation.)
     '''
+    __slots__ = ('_collate_cache',)
+
     def __init__(self):
         self._collate_cache = {}
 
@@ -270,8 +323,25 @@ class CO3(metaclass=FormatRegistryMeta):
         '''
         Method to define how a subtype's inserts should be handled under ``collect`` for
         canonical attributes, i.e., inserts to the type's table.
+
+        Slot attributes are read through the slot names fixed by the metaclass (unset
+        slots are skipped), alongside the instance ``__dict__`` when the type has one.
+        The internal collation cache is held in a base slot and is never included.
         '''
-        return vars(self)
+        attr_names = self._attr_names
+        if not attr_names:
+            return vars(self) if self._instance_dict else {}
+
+        attributes = {
+            name: value
+            for name in attr_names
+            if (value := getattr(self, name, _MISSING)) is not _MISSING
+        }
+
+        if self._instance_dict:
+            attributes.update(vars(self))
+
+        return attributes
 
     @property
     def components(self):
@@ -320,7 +390,10 @@ class CO3(metaclass=FormatRegistryMeta):
         if (key, group) in self._collate_cache and pure_compose:
             return self._collate_cache[(key, group)]
 
-        if key not in self.key_registry:
+        key_registry = self.key_registry
+        group_methods = key_registry.get(key)
+
+        if group_methods is None:
             # keys can't match implicit group if that group isn't explicitly provided
             if group is None:
                 logger.debug(
@@ -328,7 +401,7 @@ class CO3(metaclass=FormatRegistryMeta):
                 )
                 return None
 
-            method = self.key_registry[None].get(group)
+            method = key_registry.get(None, {}).get(group)
             if method is None:
                 logger.debug(
                     f'Collation key "{key}" not registered and group "{group}" not implicit'
@@ -337,7 +410,7 @@ class CO3(metaclass=FormatRegistryMeta):
 
             result = method(self, key, *args, **kwargs)
         else:
-            method = self.key_registry[key].get(group)
+            method = group_methods.get(group)
             if method is None:
                 logger.debug(
                     f'Collation key "{key}" registered, but group "{group}" is not available'
@@ -21,9 +21,10 @@ Note:
 '''
 
 from pathlib import Path
-from collections import defaultdict
 import logging
-from uuid import uuid4
+from types import MappingProxyType
+from contextlib import contextmanager
+from secrets import token_hex
 
 import sqlalchemy as sa
 
@@ -39,10 +40,21 @@ class Collector[C: Component]:
         self.schema = schema
 
         self._inserts = {}
+        self._batch_receipt = None
+
+        self._inserts_view = None
 
     @property
     def inserts(self):
-        return self._inserts_from_receipts()
+        '''
+        Read-only view of all staged inserts, grouped by Component. The grouping is cached
+        until inserts are next added or collected, so repeated reads don't re-walk every
+        receipt. Treat the returned lists as read-only as well.
+        '''
+        if self._inserts_view is None:
+            self._inserts_view = MappingProxyType(self._inserts_from_receipts())
+
+        return self._inserts_view
 
     def _inserts_from_receipts(self, receipts: list[str]|None=None, pop=False):
         '''
@@ -50,38 +62,66 @@ class Collector[C: Component]:
         Optionally provide a list of ``receipts`` to group up only the corresponding subset of
         inserts, and ``pop`` to remove encountered receipts from the internal store.
         '''
-        inserts = defaultdict(list)
-        
-        if receipts is None:
-            receipts = list(self._inserts.keys())
+        if pop:
+            self._inserts_view = None
 
-        for receipt in receipts:
+        if receipts is None:
+            # take all stored inserts directly, rather than by per-receipt lookups
+            receipt_lists = self._inserts.values()
             if pop:
-                receipt_tuple = self._inserts.pop(receipt, None)
-            else:
-                receipt_tuple = self._inserts.get(receipt, None)
+                self._inserts = {}
+        else:
+            take = self._inserts.pop if pop else self._inserts.get
+            receipt_lists = (take(receipt, None) for receipt in receipts)
 
-            if receipt_tuple is not None:
-                component, insert_data = receipt_tuple
-                inserts[component].append(insert_data)
+        inserts = {}
+        for receipt_list in receipt_lists:
+            if receipt_list is None:
+                continue
 
-        return dict(inserts)
+            for component, insert_data in receipt_list:
+                component_inserts = inserts.get(component)
+                if component_inserts is None:
+                    inserts[component] = [insert_data]
+                else:
+                    component_inserts.append(insert_data)
+
+        return inserts
 
     def _reset_session(self):
-        self._inserts = defaultdict(lambda: defaultdict(list))
+        self._inserts = {}
+        self._inserts_view = None
 
     def _generate_unique_receipt(self):
-        receipt = str(uuid4())
+        receipt = token_hex(16)
         while receipt in self._inserts:
-            receipt = str(uuid4())
+            receipt = token_hex(16)
 
         return receipt
 
+    @contextmanager
+    def batch(self):
+        '''
+        Stage all inserts added in this context under a single receipt, rather than
+        generating one per insert. Yields the shared receipt. Nested batches join the
+        outermost one.
+        '''
+        if self._batch_receipt is not None:
+            yield self._batch_receipt
+            return
+
+        self._batch_receipt = self._generate_unique_receipt()
+        try:
+            yield self._batch_receipt
+        finally:
+            self._batch_receipt = None
+
     def add_insert(
         self,
         component   : C,
         insert_data : dict,
         receipts    : list | None = None,
+        receipt     : str | None  = None,
     ):
         '''
         Parameters:
@@ -89,19 +129,78 @@ class Collector[C: Component]:
             insert_data: dict with (possibly raw/incomplete) insert data
             receipts:    optional list to which generated receipt should be appended.
                          Accommodates the common receipt list aggregation pattern.
+                         Receipts are only appended the first time they're used, so
+                         batched inserts contribute a single entry.
+            receipt:     optional existing receipt to stage the insert under. Defaults to
+                         the current ``batch()`` receipt, if any, else a new receipt.
         '''
         if component not in self.schema:
             #logger.debug(f'Inserts provided for non-existent table {table_name}')
             return None
 
-        receipt = self._generate_unique_receipt()
-        self._inserts[receipt] = (
-            component,
-            component.prepare_insert_data(insert_data),
-        )
+        if receipt is None:
+            receipt = self._batch_receipt
+        if receipt is None:
+            receipt = self._generate_unique_receipt()
+
+        insert_tuple = (component, component.prepare_insert_data(insert_data))
+        self._inserts_view = None
+
+        receipt_list = self._inserts.get(receipt)
+        if receipt_list is None:
+            self._inserts[receipt] = [insert_tuple]
+
+            if receipts is not None:
+                receipts.append(receipt)
+        else:
+            receipt_list.append(insert_tuple)
+
+        return receipt
+
+    def add_inserts(
+        self,
+        component        : C,
+        insert_data_list : list[dict],
+        receipts         : list | None = None,
+        receipt          : str | None  = None,
+    ):
+        '''
+        Stage several inserts for a single Component under one receipt. Equivalent to
+        calling ``add_insert`` for each item under a shared receipt, without the
+        per-insert receipt handling.
+
+        Parameters:
+            component:        Component from registered schema
+            insert_data_list: dicts with (possibly raw/incomplete) insert data
+            receipts:         optional list to which the receipt should be appended (see
+                              ``add_insert``)
+            receipt:          optional existing receipt to stage the inserts under (see
+                              ``add_insert``)
+        '''
+        if component not in self.schema:
+            return None
+
+        prepare = component.prepare_insert_data
+        insert_tuples = [(component, prepare(d)) for d in insert_data_list]
+
+        if not insert_tuples:
+            return None
+
+        if receipt is None:
+            receipt = self._batch_receipt
+        if receipt is None:
+            receipt = self._generate_unique_receipt()
+
+        self._inserts_view = None
+
+        receipt_list = self._inserts.get(receipt)
+        if receipt_list is None:
+            self._inserts[receipt] = insert_tuples
 
-        if receipts is not None:
-            receipts.append(receipt)
+            if receipts is not None:
+                receipts.append(receipt)
+        else:
+            receipt_list.extend(insert_tuples)
 
         return receipt
 
@@ -6,6 +6,8 @@ class Component[T]:
     can be thought of generally as named data containers/entities serving as a fundamental
     abstractions within particular storage protocols.
     '''
+    __slots__ = ('name', 'obj')
+
     def __init__(self, name, obj: T):
         self.name = name
         self.obj  = obj
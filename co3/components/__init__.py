@@ -6,6 +6,7 @@ Dev note:
 '''
 
 from typing import Self
+from functools import lru_cache
 from abc import ABCMeta, abstractmethod
 
 import sqlalchemy as sa
@@ -18,6 +19,8 @@ class ComposableComponent[T](Component[T], metaclass=ABCMeta):
     '''
     Components that can be composed with others of the same type.
     '''
+    __slots__ = ()
+
     @abstractmethod
     def compose(self, component: Self, on, outer=False) -> Self:
         '''
@@ -53,6 +56,8 @@ class Relation[T](ComposableComponent[T]):
         needed for a few CO3 contexts, and commonly off-loading most of the heavy-lifting to
         true relation objects like SQLAlchemy tables.
     '''
+    __slots__ = ()
+
     def compose(
         self,
         _with: Self,
@@ -61,7 +66,30 @@ class Relation[T](ComposableComponent[T]):
     ):
         return self
 
+@lru_cache(maxsize=1024)
+def _column_defaults(table: SQLTableLike, include_all: bool) -> dict:
+    '''
+    Column:default pairs for ``table`` (see ``SQLTable.get_column_defaults``). Cached
+    per table object, so the returned dict must not be modified.
+    '''
+    default_values = {}
+    for column in table.columns:
+        name, default = column.name, column.default
+
+        if default is not None:
+            default_values[name] = default.arg
+        elif column.nullable:
+            default_values[name] = None
+        elif include_all and name != 'id':
+            # assume empty string if include_all and col has no explicit default 
+            # and isn't nullable
+            default_values[name] = ''
+
+    return default_values
+
 class SQLTable(Relation[SQLTableLike]):
+    __slots__ = ()
+
     @classmethod
     def from_table(cls, table: sa.Table):
         '''
@@ -75,33 +103,23 @@ class SQLTable(Relation[SQLTableLike]):
 
     def get_column_defaults(self, include_all=True):
         '''
-        Provide column:default pairs for a provided SQLAlchemy table.
+        Provide column:default pairs for a provided SQLAlchemy table. Defaults are read
+        from the table's columns once per table and copied out on each call.
 
         Parameters:
             include_all: whether to include all columns, even those without explicit defaults
         '''
-        default_values = {}
-        for column in self.get_attributes():
-            if column.default is not None:
-                default_values[column.name] = column.default.arg
-            elif column.nullable:
-                default_values[column.name] = None
-            else:
-                # assume empty string if include_all and col has no explicit default 
-                # and isn't nullable
-                if include_all and column.name != 'id':
-                    default_values[column.name] = ''
-
-        return default_values
+        return dict(_column_defaults(self.obj, include_all))
 
     def prepare_insert_data(self, insert_data: dict) -> dict:
         '''
-        Modifies insert dictionary with full table column defaults
+        Modifies insert dictionary with full table column defaults. ``insert_data`` can be
+        any mapping; only the table's columns are looked up in it.
         '''
         insert_dict = self.get_column_defaults()
-        insert_dict.update(
-            { k:v for k,v in insert_data.items() if k in insert_dict }
-        )
+        for k in insert_dict:
+            if k in insert_data:
+                insert_dict[k] = insert_data[k]
 
         return insert_dict
 
@@ -112,19 +130,21 @@ class SQLTable(Relation[SQLTableLike]):
         )
 
 class FTSTable(Relation[SQLTableLike]):
-    pass
+    __slots__ = ()
 
 # key-value stores
 class Dictionary(Relation[dict]):
+    __slots__ = ()
+
     def get_attributes(self):
         return tuple(self.obj.keys())
 
 
 # document databases
 class Document[T](Component[T]):
-    pass
+    __slots__ = ()
 
 
 # graph databases
 class Node[T](Component[T]):
-    pass
+    __slots__ = ()
@@ -52,8 +52,19 @@ might otherwise be handled explicitly, as seen above.
     This means a user can invoke these methods in their own Connection contexts (seen
     above) and group up operations as they please, reducing overhead. The Database then
     wraps up a few single-operation contexts where outer connection control is not needed.
+
+    Several of these directly callable methods can also share a single connection by
+    running them in a ``session()`` context:
+
+    .. code-block:: python
+
+        with db.session():
+            db.select(<query>)
+            db.select(<query>)
 '''
 import logging
+from contextvars import ContextVar
+from contextlib import contextmanager
 
 from co3.engine   import Engine
 from co3.schema   import Schema
@@ -113,10 +124,53 @@ class Database[C: Component]:
 
         self.accessor = self._accessor_cls()
         self.manager  = self._manager_cls()
-        self.indexer  = Indexer(self.accessor)
+        # index through the Database so cached queries get a (session) connection
+        self.indexer  = Indexer(self)
 
         self._local_cache = {}
         self._reset_cache = False
+        self._written_components = set()
+
+        # queue index cache clears only when the manager actually writes
+        self.manager.add_write_callback(self._queue_cache_reset)
+
+        self._session_connection = ContextVar(
+            f'session_connection_{id(self)}',
+            default=None
+        )
+
+    @contextmanager
+    def session(self):
+        '''
+        Hold a single connection open for the directly callable methods (``select``,
+        ``insert``) run in this context, rather than checking one out for each call.
+        Sessions are context-local, so separate threads/tasks each get their own.
+
+        Note that separate sessions are only as isolated as the engine's connections.
+        Under in-memory SQLite (see ``SQLEngine``), all sessions share one underlying
+        connection and transaction, so commits and rollbacks cross session boundaries.
+        '''
+        connection = self._session_connection.get()
+        if connection is not None:
+            yield self
+            return
+
+        with self.engine.connect() as connection:
+            token = self._session_connection.set(connection)
+            try:
+                yield self
+            finally:
+                self._session_connection.reset(token)
+
+    @contextmanager
+    def _connect(self):
+        connection = self._session_connection.get()
+        if connection is not None:
+            yield connection
+            return
+
+        with self.engine.connect() as connection:
+            yield connection
 
     def raw_query(self, connection, query):
         raise NotImplementedError
@@ -129,8 +183,15 @@ class Database[C: Component]:
             passthrough method adopting arbitrary parameters in subtypes. I could simply
             overload this method in the relevant inheriting DBs (i.e., by matching the
             expected Accessor's .select signature).
+
+        Streamed selects (``stream=<n>``) return a generator that holds its connection
+        open until the rows are exhausted or the generator is closed, so they can be
+        consumed outside of a ``session()``.
         '''
-        with self.engine.connect() as connection:
+        if kwargs.get('stream'):
+            return self._stream_select(component, *args, **kwargs)
+
+        with self._connect() as connection:
             return self.accessor.select(
                 connection,
                 component,
@@ -138,34 +199,61 @@ class Database[C: Component]:
                 **kwargs
             )
 
+    def _stream_select(self, component: C, *args, **kwargs):
+        if kwargs.get('include_cols'):
+            raise ValueError('include_cols is not supported for streamed selects')
+
+        with self._connect() as connection:
+            yield from self.accessor.select(
+                connection,
+                component,
+                *args,
+                **kwargs
+            )
+
     def insert(self, component: C, *args, **kwargs):
-        with self.engine.connect() as connection:
-            return self.manager.insert(
+        with self._connect() as connection:
+            res = self.manager.insert(
                 connection,
                 component,
                 *args,
                 **kwargs
             )
 
+        # fallback for managers that don't report their writes through callbacks
+        self._queue_cache_reset([component])
+
+        return res
+
     def recreate(self, schema: Schema[C]):
         self.manager.recreate(schema, self.engine)
+        self._queue_cache_reset(schema._component_set)
+
+    def _queue_cache_reset(self, components):
+        '''
+        Manager write callback: queue invalidation of the written components' entries in
+        the external index, and wipe the local index.
+        '''
+        self._reset_cache = True
+        self._written_components.update(components)
+        self._local_cache = {}
 
     @property
     def index(self):
-        if self.reset_cache:
-            self._index.cache_clear()
-            self.reset_cache = False
-        return self._index
+        if self._reset_cache:
+            self.indexer.invalidate_tables(self._written_components)
+            self._written_components = set()
+            self._reset_cache = False
+        return self.indexer
 
     @property
     def manage(self):
         '''
-        Accessing ``.manage`` queues a cache clear on the external index, as well wipes the
-        local index.
+        Index caches are invalidated when the manager completes a write (see
+        ``Manager.add_write_callback``), not on access to ``.manage``; reading manager
+        state leaves cached results intact.
         '''
-        self.reset_cache = True
-        self._local_cache = {}
-        return self._manage
+        return self.manager
 
     def populate_indexes(self): pass
 
@@ -6,11 +6,40 @@ from co3.engine import Engine
 
 
 class SQLEngine(Engine):
+    '''
+    Engine wrapping a SQLAlchemy engine.
+
+    .. admonition:: In-memory SQLite
+
+        In-memory SQLite URLs (``sqlite://``, ``sqlite:///:memory:``) are given a
+        ``StaticPool`` over a single connection shared by all threads (unless a
+        ``poolclass`` is provided), so every thread sees the same database. The flip
+        side is that all connections checked out from the engine, across threads and
+        ``Database.session()`` contexts, wrap that one DBAPI connection and share its
+        transaction: a ``commit()`` or ``rollback()`` in one context applies to writes
+        made in all others, and concurrent use isn't isolated. Use a file-backed
+        database where separate transactions are needed.
+    '''
     def __init__(self, url: str | sa.URL, **kwargs):
         super().__init__(url, **kwargs)
 
     def _create_manager(self):
-        return sa.create_engine(*self._manager_args, **self._manager_kwargs)
+        kwargs = self._manager_kwargs
+        if self._manager_args and 'poolclass' not in kwargs:
+            url = sa.make_url(self._manager_args[0])
+
+            # in-memory SQLite databases live only as long as their one connection;
+            # share that connection across threads rather than the default per-thread
+            # pool, where a new thread would open (and see) a fresh, empty database
+            if url.get_backend_name() == 'sqlite' and url.database in (None, '', ':memory:'):
+                connect_args = {'check_same_thread': False, **kwargs.get('connect_args', {})}
+                kwargs = {
+                    **kwargs,
+                    'poolclass': sa.pool.StaticPool,
+                    'connect_args': connect_args,
+                }
+
+        return sa.create_engine(*self._manager_args, **kwargs)
         
     def connect(self, timeout=None):
         return self.manager.connect()
@@ -21,18 +50,25 @@ class SQLEngine(Engine):
         statement,
         bind_params=None,
         include_cols=False,
+        execution_options=None,
     ):
         '''
         Execute a general SQLAlchemy statement, optionally binding provided parameters and
         returning associated column names.
 
         Parameters:
-            connection:   database connection instance
-            statement:    SQLAlchemy statement
+            connection:        database connection instance
+            statement:         SQLAlchemy statement
             bind_params: 
-            include_cols: whether to return
+            include_cols:      whether to return
+            execution_options: per-execution options (e.g., ``yield_per``) applied to
+                               this statement only, leaving the connection unchanged
         '''
-        res = connection.execute(statement, bind_params)
+        res = connection.execute(
+            statement,
+            bind_params,
+            execution_options=execution_options,
+        )
 
         if include_cols:
             cols = list(res.mappings().keys())
@@ -5,6 +5,7 @@ from collections import defaultdict
 from collections.abc import Iterable
 
 import sqlalchemy as sa
+from sqlalchemy.sql.util import find_tables
 
 
 logger = logging.getLogger(__name__)
@@ -24,6 +25,7 @@ class Indexer:
     '''
     _cls_select_cache  = {}
     _cls_groupby_cache = defaultdict(dict)
+    _cls_table_keys    = defaultdict(set)
     
     def __init__(self, accessor, cache_select=True, cache_groupby=True):
         self.accessor = accessor
@@ -47,6 +49,42 @@ class Indexer:
         self._groupby_cache.clear()
         if not group_by_only:
             self._select_cache.clear()
+            self._cls_table_keys.clear()
+
+    @staticmethod
+    def _table_names(table) -> set[str]:
+        '''
+        Names of the base tables underlying a (possibly composed) table-like object, or
+        just its string form if no SQL tables can be found.
+        '''
+        obj = getattr(table, 'obj', table)
+        if isinstance(obj, sa.FromClause):
+            names = {t.name for t in find_tables(obj)}
+            if names:
+                return names
+
+        return {str(table)}
+
+    def _register_key(self, table, cache_key):
+        for name in self._table_names(table):
+            self._cls_table_keys[name].add(cache_key)
+
+    def invalidate_tables(self, tables):
+        '''
+        Evict only the cached selects/group-bys whose queries read from any of the given
+        tables (or components wrapping them), leaving unrelated entries intact.
+        '''
+        names = set()
+        for table in tables:
+            names |= self._table_names(table)
+
+        with self._access_lock:
+            for name in names:
+                for cache_key in self._cls_table_keys.pop(name, ()):
+                    if self._select_cache is not None:
+                        self._select_cache.pop(cache_key, None)
+                    if self._groupby_cache is not None:
+                        self._groupby_cache.pop(cache_key, None)
 
     def cache_block(
         self,
@@ -122,7 +160,7 @@ class Indexer:
                 if self._select_cache is None or cache_key not in self._select_cache:
                     results = self.accessor.select(
                         table,
-                        cols=cols,
+                        columns=cols,
                         where=where,
                         distinct_on=distinct_on,
                         order_by=order_by,
@@ -133,6 +171,7 @@ class Indexer:
                     # cache results if select_cache is defined
                     if self._select_cache is not None: 
                         self._select_cache[cache_key] = results
+                        self._register_key(table, cache_key)
 
                     logger.debug(
                         f'Indexer "select" cache miss for table "{table}": access in {time.time()-start:.4f}s'
@@ -165,6 +204,7 @@ class Indexer:
 
                         if self._groupby_cache is not None:
                             self._groupby_cache[cache_key] = results
+                            self._register_key(table, cache_key)
 
                         logger.debug(
                             f'Indexer "group_by" cache miss for table "{table}": access in {time.time()-start:.4f}s'
@@ -268,48 +308,36 @@ class Indexer:
         #print(f'index_on: {index_on}')
         #print(f'index_on_names: {index_on_names}')
 
-        # "group by" block ID and wrangle the links into a list
+        # "group by" block ID and wrangle the links into a list. Rows are only
+        # materialized into dicts the first time their group is seen; later rows in the
+        # same group just contribute their aggregate entries.
         group_by_idx = {}
         for row in rows:
             # generic get
             group_by_attr = row.get(group_by)
 
-            # wrap possible mapping dict
-            row_dict = dict(row)
-
-            # add new entries; standardize 
-            #aggregates = {}
-            #for agg_name in agg_on_names:
-            #    aggregates[agg_name] = []
-            #row_dict['aggregates'] = aggregates
-            row_dict['aggregates'] = []
-
-            indexes = {}
-            for index_name in index_on_names:
-                indexes[index_name] = {}
-            row_dict['indexes'] = indexes
-
             if group_by_attr is None:
                 continue
 
-            if group_by_attr not in group_by_idx:
-                group_by_idx[group_by_attr] = row_dict
+            group_row = group_by_idx.get(group_by_attr)
+            if group_row is None:
+                # wrap possible mapping dict
+                group_row = dict(row)
+                group_row['aggregates'] = []
+                group_row['indexes'] = {
+                    index_name: {} for index_name in index_on_names
+                }
+                group_by_idx[group_by_attr] = group_row
 
             # actually include all agg cols, even if None, so agg array indexes align
             agg_dict = {
-                agg_on_names[i] : row.get(agg_col)
-                for i, agg_col in enumerate(agg_on)
+                agg_name : row.get(agg_col)
+                for agg_name, agg_col in zip(agg_on_names, agg_on)
             }
+            group_row['aggregates'].append(agg_dict)
 
-            #aggregates = group_by_idx[group_by_attr]['aggregates']
-            #for agg_key, agg_val in agg_dict.items():
-            #    aggregates[agg_key].append(agg_val)
-            aggregates = group_by_idx[group_by_attr]['aggregates']
-            aggregates.append(agg_dict)
-
-            indexes = group_by_idx[group_by_attr]['indexes']
-            for i, index_col in enumerate(index_on):
-                index_name = index_on_names[i]
+            indexes = group_row['indexes']
+            for index_name, index_col in zip(index_on_names, index_on):
                 indexes[index_name][row[index_col]] = agg_dict
 
         if return_index:
@@ -19,6 +19,27 @@ class Manager[C: Component](metaclass=ABCMeta):
     most operations need to be coordinated across tables. A few common operations are
     wrapped up in this class to then also be mirrored for the FTS counterparts.
     '''
+    def __init__(self):
+        self._write_callbacks = []
+
+    def add_write_callback(self, callback):
+        '''
+        Register a callable to be invoked with the list of written components after each
+        successful write (insert, recreate, etc). Used by wrappers like the Database to
+        invalidate caches only when data actually changes.
+
+        Callbacks are stored lazily, so subtypes that don't call ``super().__init__()``
+        still support registration.
+        '''
+        if getattr(self, '_write_callbacks', None) is None:
+            self._write_callbacks = []
+
+        self._write_callbacks.append(callback)
+
+    def _notify_write(self, components):
+        for callback in getattr(self, '_write_callbacks', ()):
+            callback(components)
+
     @abstractmethod
     def recreate(self, schema: Schema[C], engine: Engine):
         raise NotImplementedError
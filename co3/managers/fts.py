@@ -14,32 +14,69 @@ logger = logging.getLogger(__name__)
 
 class FTSManager(Manager):
     def __init__(self):
+        super().__init__()
+
         self.sql_accessor = SQLAccessor()
 
-    def recreate_from_table(self, table: str, cols):
-        inserts, res_cols = self.accessor.select(
-            table,
-            cols=cols,
-            include_cols=True,
-        )
+    def recreate_from_table(
+        self,
+        engine,
+        table: str,
+        cols=None,
+        external_content=False,
+    ):
+        '''
+        Rebuild the ``search`` FTS tables from an existing table in the same database.
+        Rows are copied with ``INSERT ... SELECT`` inside SQLite, rather than selected
+        into Python and inserted back, so memory use doesn't grow with the table.
 
+        With ``external_content``, the FTS tables only index ``table`` (rather than
+        storing copies of its rows) and are rebuilt with FTS5's ``'rebuild'`` command.
+        '''
         util.db.populate_fts5(
-            self.engine,
+            engine,
             ['search'],
-            columns=res_cols,
-            inserts=inserts,
+            columns=cols,
+            source=table,
+            external_content=external_content,
         )
 
-    def recreate(self):
-        logger.info(f'FTS recreate: insert post-processing took {time.time()-start:.2f}s')
-
+    def recreate(self, schema, engine):
+        '''
+        Rebuild the FTS tables for each of the schema's components from the component's
+        own table, for every supported tokenizer.
+        '''
         util.db.populate_fts5(
-            self.engine,
-            ['search'],
-            columns=list(cols),
-            inserts=inserts,
+            engine.manager,
+            [component.obj for component in schema._component_set],
         )
 
+        self._notify_write(list(schema._component_set))
+
+    def insert(self, connection, table: str, inserts: list[dict]):
+        '''
+        Add rows to each tokenizer's FTS table for ``table``, e.g., those built by
+        ``recreate_from_table`` (``table='search'``). Only applies to FTS tables storing
+        their own content; external content tables should be rebuilt from their source
+        instead. The transaction is left to the caller to commit.
+        '''
+        if not inserts:
+            return
+
+        columns = list(inserts[0])
+        col_str = ', '.join(columns)
+        val_str = ', '.join(':' + c for c in columns)
+
+        for tokenizer in util.db.FTS5_TOKENIZERS:
+            connection.execute(
+                sa.text(
+                    f'INSERT INTO {table}_fts_{tokenizer} ({col_str}) VALUES ({val_str})'
+                ),
+                inserts,
+            )
+
+        self._notify_write([table])
+
     def update(self): pass
 
     def sync(self): pass
@@ -41,6 +41,7 @@ import time
 import logging
 import threading
 from pathlib import Path
+from functools import lru_cache
 from concurrent.futures import wait, as_completed
 
 import sqlalchemy as sa
@@ -55,6 +56,19 @@ from co3.components import Relation, SQLTable
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=256)
+def _insert_statement(table, returning=False):
+    '''
+    INSERT construct for a table-like object, reused across bulk inserts to the same
+    table. With ``returning``, the statement emits ``RETURNING`` for all of the table's
+    columns.
+    '''
+    stmt = sa.insert(table)
+    if returning:
+        stmt = stmt.returning(*table.c)
+
+    return stmt
+
 
 class RelationalManager[R: Relation](Manager[R]):
     pass
@@ -106,30 +120,50 @@ class SQLManager(RelationalManager[SQLTable]):
         cannot be generalized at the "SQL" (general) level.
         '''
         metadata = next(iter(schema._component_set)).obj.metadata
-        metadata.drop_all(engine.manager)
-        metadata.create_all(engine.manager, checkfirst=True)
+
+        # drop and create under one transaction; every table is gone after the drop, so
+        # the create needn't check for existing tables
+        with engine.manager.begin() as connection:
+            metadata.drop_all(connection)
+            metadata.create_all(connection, checkfirst=False)
+
+        self._notify_write(list(schema._component_set))
 
     def insert(
         self,
         connection,
         component: SQLTable,
         inserts: list[dict],
-        commit=True
+        commit=True,
+        returning=False,
     ):
         '''
         Insert a group of 
 
         Parameters:
+            returning: if the dialect supports ``RETURNING`` for ``executemany``-style
+                       inserts (e.g., SQLite >= 3.35), return the inserted rows in the
+                       result, saving a follow-up ``SELECT``. Otherwise ignored, and the
+                       plain insert result is returned.
         '''
+        returning = returning and connection.dialect.insert_executemany_returning
+
         with self._insert_lock:
             res = connection.execute(
-                sa.insert(component.obj),
+                _insert_statement(component.obj, returning),
                 inserts
             )
 
+            if returning:
+                # buffer rows before commit; RETURNING results are tied to the cursor
+                res = res.all()
+
             if commit:
                 connection.commit()
 
+        # notify on every executed write, including those the caller commits
+        self._notify_write([component])
+
         return res
 
     def insert_many(self, connection, inserts: dict):
@@ -30,10 +30,12 @@ Example:
       hierarchy). As such, to fully collect from a type, the Mapper needs to leave
       registration open to various types, not just those part of the same hierarchy.
 '''
+import sys
 import logging
 from inspect import signature
 from typing import Callable, Any
-from collections import defaultdict
+from collections.abc import Mapping
+from collections import defaultdict, ChainMap
 
 from co3            import util
 from co3.co3        import CO3
@@ -70,6 +72,16 @@ class Mapper[C: Component]:
         - Consider pushing this into a Mapper factory; on init, could check if provided
           Schema wraps up composable Components or not
     '''
+    __slots__ = (
+        'schema',
+        'collector',
+        'attribute_comps',
+        'collation_groups',
+        '_coll_comp_index',
+        '_type_chain_cache',
+        '_collation_plan_cache',
+    )
+
     _collector_cls: type[Collector[C]] = Collector[C]
 
     def __init__(self, schema: Schema[C]):
@@ -83,7 +95,12 @@ class Mapper[C: Component]:
         self.collector = self._collector_cls(schema)
 
         self.attribute_comps:  dict[type[CO3], C] = {}
-        self.collation_groups: dict[type[CO3], dict[str|None, C]] = defaultdict(dict)
+        self.collation_groups: dict[type[CO3], dict[str|None, C]] = {}
+
+        self._coll_comp_index: dict[tuple[type[CO3], str|None], C] = {}
+
+        self._type_chain_cache: dict[type[CO3], tuple] = {}
+        self._collation_plan_cache: dict[tuple, tuple] = {}
 
     def _check_component(self, comp: str | C, strict=True):
         if type(comp) is str:
@@ -126,6 +143,9 @@ class Mapper[C: Component]:
             coll_groups: storage components for named collation groups; dict mapping group
                          names to components
         '''
+        self._type_chain_cache = {}
+        self._collation_plan_cache = {}
+
         # check attribute component in registered schema
         attr_comp = self._check_component(attr_comp, strict=strict)
         self.attribute_comps[type_ref] = attr_comp
@@ -133,21 +153,32 @@ class Mapper[C: Component]:
         # check default component in registered schema
         if coll_comp is not None:
             coll_comp = self._check_component(coll_comp, strict=strict)
-            self.collation_groups[type_ref][None] = coll_comp
+            self.collation_groups.setdefault(type_ref, {})[None] = coll_comp
+            self._coll_comp_index[(type_ref, None)] = coll_comp
 
         # check if any component in group dict not in registered schema
+        # (group names are interned to match those registered by ``collate``)
         if coll_groups is not None:
-            for coll_key in coll_groups:
-                coll_groups[coll_key] = self._check_component(coll_groups[coll_key], strict=strict)
+            coll_groups = {
+                sys.intern(coll_key) if type(coll_key) is str else coll_key:
+                    self._check_component(coll_groups[coll_key], strict=strict)
+                for coll_key in coll_groups
+            }
 
-            self.collation_groups[type_ref].update(coll_groups)
+            self.collation_groups.setdefault(type_ref, {}).update(coll_groups)
+            for coll_key, coll_group_comp in coll_groups.items():
+                self._coll_comp_index[(type_ref, coll_key)] = coll_group_comp
 
     def attach_many(
         self,
         type_list: list[type[CO3]],
-        attr_name_map: Callable[[type[CO3]], str | C],
-        coll_name_map: Callable[[type[CO3], str], str | C] | None = None,
-        strict                                                    = False,
+        attr_name_map: Callable[[type[CO3]], str | C] | Mapping[type[CO3], str | C],
+        coll_name_map: (
+            Callable[[type[CO3], str], str | C]
+            | Mapping[tuple[type[CO3], str], str | C]
+            | None
+        ) = None,
+        strict = False,
     ) -> None:
         '''
         Auto-register a set of types to the Mapper's attached Schema. Associations are
@@ -163,12 +194,23 @@ class Mapper[C: Component]:
                            collation component names in the attached Mapper Schema. ``None``
                            is passed as the action group to retrieve the default
                            collection target.
+
+        Either map can instead be given as a precomputed mapping, indexed by type for
+        ``attr_name_map`` and by ``(type, group)`` pairs for ``coll_name_map``. Groups
+        missing from a collation mapping are left unattached.
         '''
         for _type in type_list:
-            attr_comp = attr_name_map(_type)
-            coll_groups = {}
+            if isinstance(attr_name_map, Mapping):
+                attr_comp = attr_name_map[_type]
+            else:
+                attr_comp = attr_name_map(_type)
 
-            if coll_name_map:
+            coll_groups = {}
+            if isinstance(coll_name_map, Mapping):
+                for group in _type.group_registry:
+                    if (coll_name := coll_name_map.get((_type, group))) is not None:
+                        coll_groups[group] = coll_name
+            elif coll_name_map:
                 for group in _type.group_registry:
                     coll_groups[group] = coll_name_map(_type, group)
 
@@ -186,14 +228,94 @@ class Mapper[C: Component]:
 
     def get_coll_comp(
         self,
-        co3_ref: CO3 | type[CO3],
-        group=str | None,
+        co3_ref : CO3 | type[CO3],
+        group   : str | None = None,
     ) -> C | None:
         type_ref = co3_ref
         if isinstance(co3_ref, CO3):
             type_ref = co3_ref.__class__
 
-        return self.collation_groups.get(type_ref, {}).get(group, None)
+        return self._coll_comp_index.get((type_ref, group))
+
+    def _type_chain(self, type_ref: type[CO3]) -> tuple:
+        '''
+        Resolve the attached components along ``type_ref``'s inheritance chain, as a tuple
+        of ``(attribute component, collation group dict)`` pairs ordered from the root
+        type down. Types without an attribute component are left out. Chains are cached
+        per type and reset on ``attach``, and shared by ``collect`` and ``compose``.
+        '''
+        chain = self._type_chain_cache.get(type_ref)
+
+        if chain is None:
+            chain = tuple(
+                (attr_comp, self.collation_groups.get(_cls, {}))
+                for _cls in reversed(type_ref.__mro__[:-2])
+                if (attr_comp := self.attribute_comps.get(_cls)) is not None
+            )
+            self._type_chain_cache[type_ref] = chain
+
+        return chain
+
+    def _collation_plan(
+        self,
+        type_ref : type[CO3],
+        keys     : list[str],
+        groups   : list[str] | None,
+    ) -> tuple:
+        '''
+        Resolve the collation methods to run for ``keys`` on ``type_ref``, as a tuple of
+        ``(key, method_groups)`` pairs. ``method_groups`` holds a tuple of group names for
+        each distinct registered method (its "method equivalence class"), so the method
+        only need run once per class. Groups without a collation component anywhere up
+        the type chain are left out, and keys left with no groups are dropped, so
+        methods whose results would be discarded aren't run. Plans are cached by type,
+        keys, and groups, and reset on ``attach``.
+        '''
+        plan_key = (type_ref, tuple(keys), None if groups is None else tuple(groups))
+        plan = self._collation_plan_cache.get(plan_key)
+
+        if plan is None:
+            key_registry = type_ref.key_registry
+
+            # groups with a collation target somewhere up the chain
+            target_groups = set()
+            for _, coll_comps in self._type_chain(type_ref):
+                target_groups.update(coll_comps)
+
+            plan = []
+            for key in keys:
+                # keys must be defined
+                if key is None:
+                    continue
+
+                # if groups not specified, dynamically grab those explicitly attached
+                # groups for each key
+                key_groups = key_registry.get(key, {})
+                if groups is None:
+                    group_dict = key_groups
+                else:
+                    group_dict = {group: key_groups.get(group) for group in groups}
+
+                # method regroup: under key, index by method and run once per
+                method_groups = defaultdict(list)
+                for group_name, group_method in group_dict.items():
+                    if group_name in target_groups:
+                        method_groups[group_method].append(group_name)
+
+                if not method_groups:
+                    continue
+
+                logger.debug(
+                    f'Method equivalence classes for key "{key}": '
+                    + f'"{list(method_groups.values())}"'
+                )
+
+                plan.append((key, tuple(map(tuple, method_groups.values()))))
+
+            plan = tuple(plan)
+            self._collation_plan_cache[plan_key] = plan
+
+        return plan
 
     def collect(
         self,
@@ -219,41 +341,56 @@ class Mapper[C: Component]:
                    contexts registered for the keys will be inferred (but implicit groups
                    will not be detected).
 
+        .. admonition:: Repeated references
+
+            Objects are de-duplicated by identity within a single call: an object
+            reachable more than once (e.g., held by two attributes of the same parent,
+            shared across components, or referred back to in a cycle) is collated and
+            staged only on its first visit, so it yields one set of inserts rather than
+            one per reference. Distinct but equal objects are still collected
+            separately, and no de-duplication happens *across* calls (including across
+            the objects passed to ``collect_many``).
+
         Returns: collector receipts for staged inserts
         '''
+        return self._collect(obj, keys, groups, set())
+
+    def _collect(
+        self,
+        obj    : CO3,
+        keys   : list[str] | None,
+        groups : list[str] | None,
+        seen   : set[int],
+    ) -> list:
+        '''
+        Body of ``collect``, tracking the ids of objects already collected in ``seen``;
+        objects whose id is already present are skipped without staging anything.
+        '''
+        if id(obj) in seen:
+            return []
+        seen.add(id(obj))
+
         # default is to have no actions
         if keys is None:
             keys = []
             #keys = list(obj.key_registry.keys())
 
-        collation_data = defaultdict(dict)
-        for key in keys:
-            # keys must be defined
-            if key is None:
-                continue
-
-            logger.debug(f'Collecting for key "{key}"')
-
-            # if groups not specified, dynamically grab those explicitly attached groups
-            # for each key
-            group_dict = {}
-            if groups is None:
-                group_dict = obj.key_registry.get(key, {})
-            else:
-                for group in groups:
-                    group_dict[group] = obj.key_registry.get(key, {}).get(group)
+        # with no attached types up the chain, nothing would be staged for obj itself;
+        # skip straight to its components. Keys are still passed down to components.
+        chain = self._type_chain(obj.__class__)
 
-            # method regroup: under key, index by method and run once per
-            method_groups = defaultdict(list)
-            for group_name, group_method in group_dict.items():
-                method_groups[group_method].append(group_name)
+        collation_plan = ()
+        if chain and keys:
+            collation_plan = self._collation_plan(obj.__class__, keys, groups)
 
-            logger.debug(f'Method equivalence classes: "{list(method_groups.values())}"')
+        collation_data = {}
+        for key, method_groups in collation_plan:
+            logger.debug(f'Collecting for key "{key}"')
 
             # collate for method equivalence classes; only need on representative group to
             # pass to CO3.collate to call the method
             key_collation_data = {}
-            for collation_method, collation_groups in method_groups.items():
+            for collation_groups in method_groups:
                 collation_result = obj.collate(key, group=collation_groups[0])
 
                 if not util.types.is_dictlike(collation_result):
@@ -273,23 +410,19 @@ class Mapper[C: Component]:
                     if connective_data is None:
                         connective_data = {}
 
-                    key_collation_data[collation_group] = {
-                        **connective_data,
-                        **key_method_collation_data, 
-                    }
+                    # layered view (collation data takes precedence); inserts are copied
+                    # into column-keyed dicts when staged, so no merged dict is needed
+                    key_collation_data[collation_group] = ChainMap(
+                        key_method_collation_data,
+                        connective_data,
+                    )
 
             collation_data[key] = key_collation_data
 
         receipts = []
-        attributes = obj.attributes
-
-        for _cls in reversed(obj.__class__.__mro__[:-2]):
-            attribute_component = self.get_attr_comp(_cls)
-
-            # require an attribute component for type consideration
-            if attribute_component is None:
-                continue
+        attributes = obj.attributes if chain else None
 
+        for attribute_component, coll_comps in chain:
             self.collector.add_insert(
                 attribute_component,
                 attributes,
@@ -302,7 +435,7 @@ class Mapper[C: Component]:
                     continue
 
                 for group, group_collation_data in key_collation_data.items():
-                    collation_component = self.get_coll_comp(_cls, group=group)
+                    collation_component = coll_comps.get(group)
 
                     if collation_component is None:
                         continue
@@ -314,8 +447,34 @@ class Mapper[C: Component]:
                     )
 
         # handle components
-        for comp in [c for c in obj.components if isinstance(c, CO3)]:
-            receipts.extend(self.collect(comp, keys=keys, groups=groups))
+        for comp in obj.components:
+            if isinstance(comp, CO3):
+                receipts.extend(self._collect(comp, keys, groups, seen))
+
+        return receipts
+
+    def collect_many(
+        self,
+        objs   : list[CO3],
+        keys   : list[str] = None,
+        groups : list[str] = None,
+    ) -> list:
+        '''
+        Collect from several CO3 instances, staging all of their inserts under a single
+        collector receipt (see ``Collector.batch()``). Type chains and collation plans
+        are resolved once per type and reused across objects.
+
+        Parameters:
+            objs:   CO3 instances to collect from
+            keys:   keys for actions to collect from (see ``collect``)
+            groups: group contexts for the keys to collect from (see ``collect``)
+
+        Returns: collector receipts for staged inserts
+        '''
+        receipts = []
+        with self.collector.batch():
+            for obj in objs:
+                receipts.extend(self.collect(obj, keys=keys, groups=groups))
 
         return receipts
 
@@ -395,10 +554,19 @@ class ComposableMapper[C: ComposableComponent](Mapper[C]):
 
     .. admonition:: Instance variables
 
-        - ``type_compose_cache``: index for previously computed compositions. This index
-                                  is reset if either ``attach`` or ``attach_many`` is
-                                  called to allow possible new type propagation.
+        - ``_compose_cache``: index for previously computed compositions, keyed by type,
+                              groups, and compose args/kwargs (when hashable). This
+                              index is reset if either ``attach`` or ``attach_many`` is
+                              called to allow possible new type propagation.
     '''
+    __slots__ = (
+        'attr_compose_map',
+        'coll_compose_map',
+        '_coll_map_takes_last',
+        '_compose_cache',
+        '_condition_cache',
+    )
+
     def __init__(
         self,
         schema           : Schema[C],
@@ -410,7 +578,14 @@ class ComposableMapper[C: ComposableComponent](Mapper[C]):
         self.attr_compose_map = attr_compose_map
         self.coll_compose_map = coll_compose_map
 
+        # whether the collation map also takes the previous level's collation comps
+        self._coll_map_takes_last = (
+            coll_compose_map is not None
+            and len(signature(coll_compose_map).parameters) > 2
+        )
+
         self._compose_cache = {}
+        self._condition_cache = {}
 
     def attach(self, *args, **kwargs):
         self._compose_cache = {}
@@ -422,6 +597,24 @@ class ComposableMapper[C: ComposableComponent](Mapper[C]):
 
         super().attach_many(*args, **kwargs)
 
+    def _compose_condition(self, compose_map, *comps):
+        '''
+        Join condition from ``compose_map`` for the provided components. Conditions
+        between fixed components don't change, so each is built once and reused across
+        compositions.
+        '''
+        cond_key = (
+            compose_map,
+            *(tuple(c) if type(c) is list else c for c in comps)
+        )
+
+        condition = self._condition_cache.get(cond_key)
+        if condition is None:
+            condition = compose_map(*comps)
+            self._condition_cache[cond_key] = condition
+
+        return condition
+
     def compose(
         self,
         co3_ref        : CO3 | type[CO3],
@@ -452,21 +645,26 @@ class ComposableMapper[C: ComposableComponent](Mapper[C]):
         if compose_args is None: compose_args = []
         if compose_kwargs is None: compose_kwargs = {}
 
-        idx_tup = (type_ref, tuple(groups))
-        pure_compose = not (compose_args or compose_kwargs)
-        if idx_tup in self._compose_cache and pure_compose:
-            return self._compose_cache[idx_tup]
+        # compositions are cached by their full signature; unhashable compose args
+        # (e.g., lists) skip the cache
+        try:
+            idx_tup = (
+                type_ref,
+                tuple(groups),
+                tuple(compose_args),
+                frozenset(compose_kwargs.items()),
+            )
+            hash(idx_tup)
+
+            if idx_tup in self._compose_cache:
+                return self._compose_cache[idx_tup]
+        except TypeError:
+            idx_tup = None
 
         comp_agg = None
         last_attr_comp = None
         last_coll_comps = None
-        for _cls in reversed(type_ref.__mro__[:-2]):
-            attr_comp = self.get_attr_comp(_cls)
-
-            # require an attribute component for type consideration
-            if attr_comp is None:
-                continue
-
+        for attr_comp, coll_comps in self._type_chain(type_ref):
             if comp_agg is None:
                 comp_agg = attr_comp
             else:
@@ -477,7 +675,11 @@ class ComposableMapper[C: ComposableComponent](Mapper[C]):
                 # components, as compositions don't also expose the necessary attributes
                 # (or if they do, they aren't necessarily unique; e.g., JOIN two
                 # SQLAlchemy tables does not allow direct column access).
-                compose_condition = self.attr_compose_map(last_attr_comp, attr_comp)
+                compose_condition = self._compose_condition(
+                    self.attr_compose_map,
+                    last_attr_comp,
+                    attr_comp,
+                )
                 comp_agg = comp_agg.compose(
                     attr_comp,
                     compose_condition,
@@ -488,7 +690,7 @@ class ComposableMapper[C: ComposableComponent](Mapper[C]):
             # compose horizontally with components from provided action groups
             coll_list = []
             for group in groups:
-                coll_comp = self.get_coll_comp(_cls, group=group)
+                coll_comp = coll_comps.get(group)
 
                 if coll_comp is None:
                     continue
@@ -500,14 +702,19 @@ class ComposableMapper[C: ComposableComponent](Mapper[C]):
                 # note how the join condition is specified using the non-composite
                 # `attr_comp` and new `coll_comp`; the composite doesn't typically
                 # have the same attribute access and needs a ref to a specific comp
-                if len(signature(self.coll_compose_map).parameters) > 2:
-                    compose_condition = self.coll_compose_map(
+                if self._coll_map_takes_last:
+                    compose_condition = self._compose_condition(
+                        self.coll_compose_map,
                         attr_comp,
                         coll_comp,
-                        last_coll_comps
+                        last_coll_comps,
                     )
                 else:
-                    compose_condition = self.coll_compose_map(attr_comp, coll_comp)
+                    compose_condition = self._compose_condition(
+                        self.coll_compose_map,
+                        attr_comp,
+                        coll_comp,
+                    )
 
                 comp_agg = comp_agg.compose(
                     coll_comp,
@@ -519,7 +726,7 @@ class ComposableMapper[C: ComposableComponent](Mapper[C]):
             last_attr_comp = attr_comp
             last_coll_comps = coll_list
 
-        if not pure_compose:
+        if idx_tup is not None:
             self._compose_cache[idx_tup] = comp_agg
 
         return comp_agg
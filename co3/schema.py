@@ -22,6 +22,8 @@ from co3.component import Component
 
 
 class Schema[C: Component]:
+    __slots__ = ('_component_set', '_component_map')
+
     def __init__(self):
         self._component_set = set()
         self._component_map = {}
@@ -7,9 +7,11 @@ from co3.components import Relation, SQLTable
 
 
 class RelationalSchema[R: Relation](Schema[R]):
-    pass
+    __slots__ = ()
 
 class SQLSchema(RelationalSchema[SQLTable]):
+    __slots__ = ()
+
     @classmethod
     def from_metadata(cls, metadata: sa.MetaData):
         instance = cls()
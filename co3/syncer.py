@@ -181,6 +181,7 @@ class Syncer[E: Equatable]:
 
         # chunk loop variables
         chunk_timer = 0   
+        s_per_item  = None
         chunk_report = defaultdict(int) 
         chunk_results = []
 
@@ -218,10 +219,21 @@ class Syncer[E: Equatable]:
                 remaining -= chunk_size
                 pbar.update(n=chunk_size)
 
-                # re-calculate the chunk size with a simple EMA
-                s_per_item = chunk_timer / chunk_size
-                new_target = chunk_time / s_per_item
-                chunk_size = int(0.5*new_target + 0.5*chunk_size)
+                # re-calculate the chunk size from an EMA of the time per item, seeded by
+                # the first chunk. Smoothing the rate (rather than the last chunk's size
+                # target) keeps one anomalous chunk from collapsing or inflating the next.
+                # Without a chunk time target, sizes stay at the cap.
+                if chunk_time:
+                    chunk_s_per_item = chunk_timer / chunk_size
+                    if s_per_item is None:
+                        s_per_item = chunk_s_per_item
+                    else:
+                        s_per_item = 0.7*s_per_item + 0.3*chunk_s_per_item
+
+                    if s_per_item > 0:
+                        chunk_size = int(chunk_time / s_per_item)
+                    else:
+                        chunk_size = chunk_cap
 
                 # apply the chunk cap and clip by remaining items
                 chunk_size = min(min(chunk_size, chunk_cap), remaining)
@@ -21,56 +21,177 @@ Example usage for this file's utilities:
             sa.insert(<table>),
             insert_dicts
         )
+
+    # or, equivalently, through the fastest path available for the engine's driver
+    db.bulk_insert(engine, <table>, insert_dicts)
 '''
 
 import time
 import logging
 import functools
 import sqlalchemy as sa
+from itertools import groupby
 from pathlib import Path
 
 
 logger = logging.getLogger(__name__)
 
+_SQLITE_PRAGMAS = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA mmap_size=268435456',
+    'PRAGMA cache_size=-200000',
+)
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
 def get_engine(db_path, echo=False):
+    '''
+    Create a SQLite engine for ``db_path``, creating its parent directories. Each new
+    connection is set to WAL journaling with ``synchronous=NORMAL`` (durable across
+    application crashes, and much cheaper per commit than the default rollback journal),
+    with in-memory temp storage, memory-mapped reads, and a larger page cache for bulk
+    writes like FTS population.
+    '''
     Path(db_path).parent.mkdir(parents=True, exist_ok=True)
-    return sa.create_engine(f"sqlite:///{db_path}", echo=echo)
+
+    engine = sa.create_engine(f"sqlite:///{db_path}", echo=echo)
+    sa.event.listen(engine, 'connect', _set_sqlite_pragmas)
+
+    return engine
 
 def named_results(table, results):
     '''
     Note the implications of this for results from compound tables containing the same
     column names: only the last column name will be indexed.
+
+    Column names are read from the table once, and each row is zipped against them.
+    See ``iter_named_results`` to convert rows lazily instead.
     '''
-    return [
-        { c.name:r[i] for i, c in enumerate(table.columns) }
-        for r in results
-    ]
+    return list(iter_named_results(table, results))
+
+def iter_named_results(table, results):
+    '''
+    Generator variant of ``named_results``, converting rows as they're consumed. Pairs
+    with the ``yield_per`` execution option to avoid holding the full result set, e.g.,
+
+    .. code-block:: python
+
+        results = connection.execute(stmt, execution_options={'yield_per': 1000})
+        for row in db.iter_named_results(<table>, results):
+            ...
+    '''
+    keys = [c.name for c in table.columns]
+    for r in results:
+        yield dict(zip(keys, r))
+
+_DEFERRED_KW    = {'deferrable': True, 'initially': 'DEFERRED'}
+_DEFERRED_CD_KW = {**_DEFERRED_KW, 'ondelete': 'CASCADE'}
+
+def bulk_insert(engine, table: sa.Table, rows: list[dict]):
+    '''
+    Insert ``rows`` (column-indexed dicts) into ``table`` in a single transaction,
+    through the fastest path available for the engine's driver:
+
+    - ``psycopg2``: ``psycopg2.extras.execute_values``, packing pages of rows into
+      multi-row ``INSERT ... VALUES`` statements
+    - ``sqlite``: the ``sqlite3`` cursor's ``executemany``, skipping SQLAlchemy's
+      per-row parameter processing
+    - otherwise: ``sa.insert``, left to SQLAlchemy's own batching
+
+    Rows are inserted in order, in runs of consecutive rows sharing the same keys. Each
+    run inserts the table's columns present in its rows, along with any omitted columns
+    that have a scalar default (filled with that default). Other omitted columns are
+    left out of the statement, so server defaults still apply. Runs omitting a column
+    with a callable or SQL expression default are handed to ``sa.insert``, which
+    evaluates those defaults.
+    '''
+    if not rows:
+        return
+
+    driver = engine.dialect.driver
+    if driver not in ('psycopg2', 'pysqlite'):
+        with engine.begin() as connection:
+            connection.execute(sa.insert(table), rows)
+        return
+
+    scalar_defaults = {}
+    python_defaults = set()
+    for c in table.c:
+        if c.default is None:
+            continue
+        if c.default.is_scalar:
+            scalar_defaults[c.name] = c.default.arg
+        else:
+            python_defaults.add(c.name)
+
+    preparer = engine.dialect.identifier_preparer
+    table_name = preparer.format_table(table)
+
+    with engine.begin() as connection:
+        cursor = connection.connection.cursor()
+        try:
+            for row_keys, run in groupby(rows, key=lambda row: row.keys()):
+                run = list(run)
+                columns = [
+                    c for c in table.c
+                    if c.name in row_keys or c.name in scalar_defaults
+                ]
+
+                if not columns or not python_defaults.issubset(row_keys):
+                    connection.execute(sa.insert(table), run)
+                    continue
+
+                params = [
+                    tuple(row.get(c.name, scalar_defaults.get(c.name)) for c in columns)
+                    for row in run
+                ]
+                sql_insert = (
+                    f'INSERT INTO {table_name} '
+                    f'({", ".join(preparer.quote(c.name) for c in columns)}) VALUES '
+                )
+
+                if driver == 'psycopg2':
+                    from psycopg2.extras import execute_values
+
+                    execute_values(cursor, sql_insert + '%s', params, page_size=1000)
+                else:
+                    placeholders = ', '.join('?' for _ in columns)
+                    cursor.executemany(sql_insert + f'({placeholders})', params)
+        finally:
+            cursor.close()
 
 def deferred_fkey(target, **kwargs):
-    return sa.ForeignKey(
-        target,
-        deferrable=True,
-        initially='DEFERRED',
-        **kwargs
-    )
+    return sa.ForeignKey(target, **_DEFERRED_KW, **kwargs)
 
 def deferred_cd_fkey(target, **kwargs):
     '''
     Prefer this when using FKEYs; need to really justify *not* having a CASCADE deletion
     enabled
     '''
-    return deferred_fkey(target, ondelete='CASCADE', **kwargs)
+    return sa.ForeignKey(target, **_DEFERRED_CD_KW, **kwargs)
 
 def get_column_names_str_table(engine, table: str):
-    col_sql = f'PRAGMA table_info({table});'
     with engine.connect() as connection:
-        try:
-            cols = connection.execute(sa.text(col_sql))
-        except sa.exc.OperationalError as e:
-            logger.error(f'Column retrieval for table "{table}" failed')
-            raise
+        return _table_column_names(connection, table)
 
-    return cols
+def _table_column_names(connection, table: str):
+    col_sql = f'PRAGMA table_info({table});'
+    try:
+        cols = connection.execute(sa.text(col_sql))
+    except sa.exc.OperationalError as e:
+        logger.error(f'Column retrieval for table "{table}" failed')
+        raise
+
+    # table_info rows are (cid, name, type, notnull, dflt_value, pk)
+    return [row[1] for row in cols]
 
 def create_fts5(
         engine,
@@ -80,6 +201,8 @@ def create_fts5(
         inserts=None,
         reset_fts=False,
         tokenizer='unicode61',
+        source: sa.Table | str | None = None,
+        external_content=False,
     ):
     '''
     Create and optionally populate an FTS5 table in SQLite. Can be used directly for
@@ -92,24 +215,77 @@ def create_fts5(
         columns: list of SQLAlchemy table columns to insert into virtual table. These
                  columns must be present in the provided table if not manually specifying
                  inserts (since the table must be queried automatically)
-        inserts: 
+        inserts: any iterable of column-indexed dicts, streamed into a single DBAPI
+                 ``executemany`` within the table's creation transaction
+        source: table to populate from when no ``inserts`` are provided, if not
+                ``table`` itself. Rows are copied with ``INSERT ... SELECT`` entirely
+                within SQLite, never passing through Python.
+        external_content: create an external content FTS table over ``source``, storing
+                          only the index (column values are read back from ``source``).
+                          Population uses FTS5's native ``'rebuild'`` command, and
+                          ``inserts`` are not supported. ``source`` must be a rowid table
+                          (or have ``rowid``-aliased primary key) that the FTS table can
+                          refer to.
     '''
+    with engine.connect() as connection:
+        _create_fts5(
+            connection,
+            table,
+            columns=columns,
+            populate=populate,
+            inserts=inserts,
+            reset_fts=reset_fts,
+            tokenizer=tokenizer,
+            source=source,
+            external_content=external_content,
+        )
+
+        connection.commit()
+
+def _create_fts5(
+        connection,
+        table: sa.Table | str,
+        columns=None,
+        populate=False,
+        inserts=None,
+        reset_fts=False,
+        tokenizer='unicode61',
+        source: sa.Table | str | None = None,
+        external_content=False,
+    ):
+    '''
+    Body of ``create_fts5`` on an open connection, leaving the transaction uncommitted.
+    '''
+    if external_content and inserts is not None:
+        raise ValueError('external content FTS tables cannot be populated from inserts')
+
     is_sa_table = isinstance(table, sa.Table)
     table_name  = table.name if is_sa_table else table
 
+    if source is None:
+        source = table
+
+    is_sa_source = isinstance(source, sa.Table)
+    source_name  = source.name if is_sa_source else source
+
     if columns is None:
-        if is_sa_table:
-            columns = [c.name for c in table.c] 
+        if is_sa_source:
+            columns = [c.name for c in source.c] 
         else:
-            columns = get_column_names_str_table(engine, table)
+            columns = _table_column_names(connection, source)
 
     col_str = ", ".join(columns)
     fts_table_name = f'{table_name}_fts_{tokenizer}'
 
+    content_str = ''
+    if external_content:
+        content_str = f"content = '{source_name}',"
+
     sql = f"""
     CREATE VIRTUAL TABLE {fts_table_name} USING fts5
     (
         {col_str},
+        {content_str}
         tokenize = '{tokenizer}'
     );
     """
@@ -120,10 +296,12 @@ def create_fts5(
         {col_str}
     )
     """
-    if inserts is None:
+    if external_content:
+        sql_insert = f"INSERT INTO {fts_table_name}({fts_table_name}) VALUES('rebuild')"
+    elif inserts is None:
         sql_insert += f"""
             SELECT {col_str}
-            FROM {table_name};
+            FROM {source_name};
         """
     else:
         sql_insert += f"""
@@ -132,43 +310,77 @@ def create_fts5(
 
     sql_drop = f"DROP TABLE IF EXISTS {fts_table_name}"
 
-    with engine.connect() as connection:
-        if reset_fts:
-            connection.execute(sa.text(sql_drop))
+    if reset_fts:
+        connection.execute(sa.text(sql_drop))
 
-        connection.execute(sa.text(sql))
+    connection.execute(sa.text(sql))
 
-        if populate:
-            if inserts is None:
-                connection.execute(sa.text(sql_insert))
-            else:
-                connection.execute(
-                    sa.text(sql_insert),
-                    inserts,
-                )
-
-        connection.commit()
+    if populate:
+        if inserts is None:
+            connection.execute(sa.text(sql_insert))
+        else:
+            # write straight through the sqlite3 cursor, under the same transaction;
+            # executemany consumes ``inserts`` lazily and binds dicts by name
+            cursor = connection.connection.cursor()
+            try:
+                cursor.executemany(sql_insert, inserts)
+            finally:
+                cursor.close()
+
+# tokenizers each FTS5 index is built for by ``populate_fts5``
+FTS5_TOKENIZERS = ('unicode61', 'porter', 'trigram')
+
+def populate_fts5(
+        engine,
+        tables,
+        columns=None,
+        inserts=None,
+        source=None,
+        external_content=False,
+    ):
+    '''
+    Create and populate FTS5 tables for each supported tokenizer. Only the first
+    tokenizer's table is populated from ``inserts`` (or ``source``, see ``create_fts5``);
+    the rest copy their rows from that first FTS table in SQL, so ``inserts`` are only
+    consumed once and can be a one-shot iterable (e.g., a generator).
 
-def populate_fts5(engine, tables, columns=None, inserts=None):
-    # create indexes
-    tokenizers = ['unicode61', 'porter', 'trigram']
-
-    for table in tables:
-        for tokenizer in tokenizers:
-            start = time.time()
-            create_fts5(
-                engine,
-                table,
-                columns=columns,
-                populate=True,
-                inserts=inserts,
-                reset_fts=True,
-                tokenizer=tokenizer
-            )
+    With ``external_content``, each tokenizer's table instead indexes ``source``
+    directly and is rebuilt by SQLite from it.
 
+    All tables are created on a single connection and committed together.
+    '''
+    with engine.connect() as connection:
+        for table in tables:
             is_sa_table = isinstance(table, sa.Table)
             table_name  = table.name if is_sa_table else table
-            print(f'Created FTS5 index for table "{table_name}+{tokenizer}"; took {time.time() - start}s')
+
+            first_fts_name = None
+            for tokenizer in FTS5_TOKENIZERS:
+                timed = logger.isEnabledFor(logging.INFO)
+                if timed:
+                    start = time.time()
+
+                _create_fts5(
+                    connection,
+                    table,
+                    columns=columns,
+                    populate=True,
+                    inserts=inserts if first_fts_name is None else None,
+                    reset_fts=True,
+                    tokenizer=tokenizer,
+                    source=source if first_fts_name is None or external_content else first_fts_name,
+                    external_content=external_content,
+                )
+
+                if first_fts_name is None:
+                    first_fts_name = f'{table_name}_fts_{tokenizer}'
+                if timed:
+                    logger.info(
+                        'Created FTS5 index for table "%s+%s"; took %.3fs',
+                        table_name, tokenizer, time.time() - start,
+                    )
+
+        connection.commit()
 
 
 def create_vss0(
@@ -188,7 +400,8 @@ def create_vss0(
         columns: list of SQLAlchemy table columns to insert into virtual table. These
                  columns must be present in the provided table if not manually specifying
                  inserts (since the table must be queried automatically)
-        inserts: 
+        inserts: any iterable of column-indexed dicts, written with a single DBAPI
+                 ``executemany``
     '''
     is_sa_table = isinstance(table, sa.Table)
     table_name  = table.name if is_sa_table else table
@@ -238,10 +451,12 @@ def create_vss0(
             if inserts is None:
                 connection.execute(sa.text(sql_insert))
             else:
-                connection.execute(
-                    sa.text(sql_insert),
-                    inserts,
-                )
+                # as in create_fts5, bind rows directly on the sqlite3 cursor
+                cursor = connection.connection.cursor()
+                try:
+                    cursor.executemany(sql_insert, inserts)
+                finally:
+                    cursor.close()
 
         connection.commit()
 
@@ -1,11 +1,57 @@
+import os
 from pathlib import Path
 
 from wcmatch import glob as wc_glob
 
 
 def iter_nested_paths(path: Path, ext: str = None, no_dir=False, relative=False):
+    '''
+    Recursively collect paths under ``path``, equivalent to globbing with
+    ``**/!(.*|*.tmp|*~)*{ext}``: hidden files and directories are skipped entirely,
+    ``*.tmp`` and ``*~`` entries are left out (though the contents of such directories
+    are still listed), and symlinked directories are listed but not followed.
+
+    Walks the tree with ``os.scandir`` rather than matching a glob pattern, so file
+    types come from the directory entries themselves (no extra ``stat`` calls) and paths
+    are only built as ``Path`` objects once they're kept.
+    '''
     if ext is None: ext = ''
-    return iter_glob_paths(f'**/!(.*|*.tmp|*~)*{ext}', path, no_dir=no_dir, relative=relative)
+
+    root = os.fspath(path)
+    paths = []
+    for rel_path, is_dir in _scan_nested(root, ''):
+        if not rel_path.endswith(ext) or (no_dir and is_dir):
+            continue
+
+        paths.append(Path(rel_path) if relative else Path(root, rel_path))
+
+    return paths
+
+def _scan_nested(root: str, prefix: str):
+    '''
+    Yield ``(relative path, is_dir)`` for non-hidden entries under ``root/prefix``,
+    recursing into (non-symlinked) directories. ``*.tmp`` and ``*~`` entries aren't
+    yielded, but directories with those names are still recursed into.
+    '''
+    try:
+        entries = list(os.scandir(os.path.join(root, prefix)))
+    except OSError:
+        return
+
+    for entry in entries:
+        name = entry.name
+        if name.startswith('.'):
+            continue
+
+        rel_path = prefix + name
+        excluded = name.endswith(('.tmp', '~'))
+
+        if entry.is_dir(follow_symlinks=False):
+            if not excluded:
+                yield rel_path, True
+            yield from _scan_nested(root, rel_path + os.sep)
+        elif not excluded:
+            yield rel_path, entry.is_dir()
 
 def iter_glob_paths(_glob, path: Path, no_dir=False, relative=False):
     '''
@@ -11,6 +11,8 @@ from co3 import util
 
 
 class Vegetable(CO3):
+    __slots__ = ('name', 'color')
+
     def __init__(self, name, color):
         super().__init__()
 
@@ -23,14 +25,12 @@ class Vegetable(CO3):
         raise NotImplementedError
 
 class Tomato(Vegetable):
+    __slots__ = ('radius',)
+
     def __init__(self, name, radius):
         super().__init__(name, 'red')
         self.radius = radius
 
-    @property
-    def attributes(self):
-        return vars(self)
-        
     def collation_attributes(self, key, group):
         return {
             'name': self.name,
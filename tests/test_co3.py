@@ -24,6 +24,34 @@ def test_co3_registry():
 def test_co3_attributes():
     assert tomato.attributes is not None
 
+def test_co3_attributes_slotted():
+    slotted = veg.Tomato('s1', 5)
+    slotted.collate('ripe', group='aging')
+
+    assert not hasattr(slotted, '__dict__')
+    assert slotted.attributes == {'name': 's1', 'color': 'red', 'radius': 5}
+
+def test_co3_attributes_unslotted_subclass():
+    class HeavyTomato(veg.Tomato):
+        def __init__(self, name, radius, weight):
+            super().__init__(name, radius)
+            self.weight = weight
+
+    heavy = HeavyTomato('h1', 10, 3)
+    heavy.collate('ripe', group='aging')
+    attributes = heavy.attributes
+
+    assert attributes == {'name': 'h1', 'color': 'red', 'radius': 10, 'weight': 3}
+
+def test_co3_attributes_unslotted():
+    class Pepper(veg.CO3):
+        def __init__(self, name):
+            super().__init__()
+            self.name = name
+
+    # the collation cache lives in a base slot, out of the instance ``__dict__``
+    assert Pepper('p1').attributes == {'name': 'p1'}
+
 def test_co3_components():
     assert tomato.components is not None
 
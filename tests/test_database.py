@@ -1,22 +1,45 @@
+import threading
+
+import pytest
+import sqlalchemy as sa
+
 from co3.components import Relation
+from co3.managers import SQLManager
 from co3.databases import SQLDatabase
 
 from setups import vegetables as veg
 
 
-db = None
+@pytest.fixture(scope='module')
+def db():
+    database = SQLDatabase('sqlite://')
+    database.recreate(veg.vegetable_schema)
+
+    return database
 
-def test_database_init():
-    global db
+def test_database_init(db):
+    assert db.engine.manager is not None
 
-    db = SQLDatabase('sqlite://')
-    assert True
-    
 def test_database_recreate():
-    db.recreate(veg.vegetable_schema)
-    assert True
+    # separate database, so rows inserted into the shared one survive
+    database = SQLDatabase('sqlite://')
+    database.recreate(veg.vegetable_schema)
+    database.recreate(veg.vegetable_schema)
+
+    assert 'tomato' in sa.inspect(database.engine.manager).get_table_names()
+
+def test_database_memory_shared(db):
+    # in-memory databases are visible from other threads
+    tables = []
+    thread = threading.Thread(
+        target=lambda: tables.extend(sa.inspect(db.engine.manager).get_table_names())
+    )
+    thread.start()
+    thread.join()
 
-def test_database_insert():
+    assert 'tomato' in tables
+
+def test_database_insert(db):
     tomato = veg.Tomato('t1', 5)
     veg.vegetable_mapper.collect(tomato)
 
@@ -34,7 +57,20 @@ def test_database_insert():
             tom_inserts,
         ) is not None
 
-def test_database_insert_many():
+def test_database_insert_returning(db):
+    tom_comp = veg.vegetable_mapper.get_attr_comp(veg.Tomato)
+
+    with db.engine.connect() as connection:
+        rows = db.manager.insert(
+            connection,
+            tom_comp,
+            [{'name': 'r1', 'radius': 4}],
+            returning=True,
+        )
+
+    assert [row.name for row in rows] == ['r1']
+
+def test_database_insert_many(db):
     tomato = veg.Tomato('t2', 5)
     veg.vegetable_mapper.collect(tomato)
 
@@ -44,7 +80,7 @@ def test_database_insert_many():
             veg.vegetable_mapper.collector.inserts,
         ) is not None
 
-def test_database_access():
+def test_database_access(db):
     agg_table = veg.vegetable_mapper.compose(veg.Tomato)
 
     with db.engine.connect() as connection:
@@ -52,3 +88,148 @@ def test_database_access():
             connection,
             agg_table,
         ) is not None
+
+def test_database_access_columns(db):
+    agg_table = veg.vegetable_mapper.compose(veg.Tomato)
+
+    with db.engine.connect() as connection:
+        rows = db.accessor.select(
+            connection,
+            agg_table,
+            columns=[veg.tomato_table.c.name],
+        )
+
+    assert rows
+    assert all(list(row.keys()) == ['name'] for row in rows)
+
+def test_database_access_stream(db):
+    agg_table = veg.vegetable_mapper.compose(veg.Tomato)
+
+    with db.engine.connect() as connection:
+        rows = db.accessor.select(connection, agg_table, stream=2)
+        assert next(iter(rows), None) is not None
+
+def test_database_select_stream(tmp_path):
+    file_db = SQLDatabase(f'sqlite:///{tmp_path / "stream.db"}')
+    file_db.recreate(veg.vegetable_schema)
+
+    tom_comp = veg.vegetable_mapper.get_attr_comp(veg.Tomato)
+    file_db.insert(tom_comp, [{'name': f's{i}', 'radius': i} for i in range(5)])
+
+    # streamed outside of a session; the connection stays checked out until consumed
+    rows = file_db.select(tom_comp, stream=2)
+    pool = file_db.engine.manager.pool
+
+    assert next(rows)['name'] == 's0'
+    assert pool.checkedout() == 1
+    assert len(list(rows)) == 4
+    assert pool.checkedout() == 0
+
+def test_database_access_one(db):
+    agg_table = veg.vegetable_mapper.compose(veg.Tomato)
+
+    with db.engine.connect() as connection:
+        row = db.accessor.select_one(
+            connection,
+            agg_table,
+        )
+
+    assert isinstance(row, dict)
+
+def test_database_session(db):
+    agg_table = veg.vegetable_mapper.compose(veg.Tomato)
+
+    with db.session():
+        conn = db._session_connection.get()
+        assert conn is not None
+
+        assert db.select(agg_table) is not None
+        assert db._session_connection.get() is conn
+
+    assert db._session_connection.get() is None
+
+def test_database_index_invalidation(db):
+    db.index
+    assert not db._reset_cache
+
+    # accessing the manager alone doesn't invalidate
+    db.manage
+    assert not db._reset_cache
+
+    tomato = veg.Tomato('t3', 5)
+    receipts = veg.vegetable_mapper.collect(tomato)
+
+    with db.engine.connect() as connection:
+        db.manage.insert_many(
+            connection,
+            veg.vegetable_mapper.collector.collect_inserts(receipts),
+        )
+
+    assert db._reset_cache
+    db.index
+    assert not db._reset_cache
+
+def test_database_index_invalidation_caller_commit(db):
+    db.index
+    tom_comp = veg.vegetable_mapper.get_attr_comp(veg.Tomato)
+
+    # writes committed by the caller still invalidate the index
+    with db.engine.connect() as connection:
+        db.manager.insert(
+            connection,
+            tom_comp,
+            [{'name': 'c1', 'radius': 2}],
+            commit=False,
+        )
+        connection.commit()
+
+    assert db._reset_cache
+    db.index
+
+def test_database_manager_without_init():
+    # skips Manager.__init__ and never reports its writes
+    class BareManager(SQLManager):
+        def __init__(self):
+            self._insert_lock = threading.RLock()
+
+        def insert(self, connection, component, inserts):
+            connection.execute(sa.insert(component.obj), inserts)
+            connection.commit()
+
+    class BareDatabase(SQLDatabase):
+        _manager_cls = BareManager
+
+    bare_db = BareDatabase('sqlite://')
+    bare_db.recreate(veg.vegetable_schema)
+    bare_db.index
+
+    tom_comp = veg.vegetable_mapper.get_attr_comp(veg.Tomato)
+    bare_db.insert(tom_comp, [{'name': 'b1', 'radius': 2}])
+
+    assert bare_db._reset_cache
+
+def test_database_index_invalidate_tables(db):
+    tom_comp = veg.vegetable_mapper.get_attr_comp(veg.Tomato)
+    veg_comp = veg.vegetable_schema.get_component('vegetable')
+
+    db.index.cache_clear()
+    tomatoes   = db.index.cached_query(tom_comp)
+    vegetables = db.index.cached_query(veg_comp)
+
+    # insert into the tomato table through the database
+    db.insert(tom_comp, [{'name': 'i1', 'radius': 3}])
+
+    # write to the vegetable table behind the manager's back; its cached results
+    # should survive the tomato insert, and so stay stale
+    with db.engine.connect() as connection:
+        connection.execute(sa.insert(veg.vegetable_table), [{'name': 'i2'}])
+        connection.commit()
+
+    fresh_tomatoes = db.index.cached_query(tom_comp)
+
+    assert len(fresh_tomatoes) == len(tomatoes) + 1
+    assert 'i1' in [row['name'] for row in fresh_tomatoes]
+    assert db.index.cached_query(veg_comp) is vegetables
+
+    db.index.cache_clear()
+    assert len(db.index.cached_query(veg_comp)) == len(vegetables) + 1
@@ -0,0 +1,235 @@
+import gc
+import sqlite3
+
+import pytest
+import sqlalchemy as sa
+
+from co3 import util
+from co3.managers import FTSManager
+from co3.schemas import SQLSchema
+from co3.engines import SQLEngine
+from co3.accessors.fts import FTSAccessor
+
+
+@pytest.fixture(scope='module')
+def connection():
+    engine = sa.create_engine('sqlite://')
+
+    with engine.connect() as connection:
+        connection.execute(sa.text(
+            'CREATE VIRTUAL TABLE notes_fts_unicode61 USING fts5(name, body, kind)'
+        ))
+        connection.execute(
+            sa.text('INSERT INTO notes_fts_unicode61 VALUES (:name, :body, :kind)'),
+            [
+                {'name': 'n1', 'body': 'a ripe red tomato',        'kind': 'fruit'},
+                {'name': 'n2', 'body': 'tomato soup with basil',  'kind': 'recipe'},
+                {'name': 'n3', 'body': 'a diced tomato salad',    'kind': 'recipe'},
+                {'name': 'n4', 'body': 'green cucumber slices',   'kind': 'fruit'},
+            ]
+        )
+        connection.commit()
+
+        yield connection
+
+def test_fts_select_query(connection):
+    rows, cols = FTSAccessor().select(
+        connection,
+        'notes',
+        search_cols='body',
+        query='tomato',
+    )
+
+    assert sorted(row['name'] for row in rows) == ['n1', 'n2', 'n3']
+    assert {'snippet', 'highlight', 'rank'} <= set(cols)
+    assert rows == sorted(rows, key=lambda row: row['rank'])
+
+def test_fts_select_wherein(connection):
+    rows, _ = FTSAccessor().select(
+        connection,
+        'notes',
+        search_cols='body',
+        query='tomato',
+        wherein_dict={'kind': ['recipe'], 'name': ['n1', 'n3']},
+    )
+
+    assert [row['name'] for row in rows] == ['n3']
+
+def test_fts_select_wherein_only(connection):
+    rows, _ = FTSAccessor().select(
+        connection,
+        'notes',
+        wherein_dict={'kind': ['fruit']},
+        limit=None,
+    )
+
+    assert sorted(row['name'] for row in rows) == ['n1', 'n4']
+
+def test_fts_select_group_by(connection):
+    rows, _ = FTSAccessor().select(
+        connection,
+        'notes',
+        search_cols='body',
+        query='tomato',
+        group_by='kind',
+        agg_cols=['name'],
+        limit=None,
+    )
+
+    groups = {row['kind']: sorted(row['name_agg']) for row in rows}
+
+    assert groups == {'fruit': ['n1'], 'recipe': ['n2', 'n3']}
+
+def test_fts_select_snippet_highlight(connection):
+    rows, _ = FTSAccessor().select(
+        connection,
+        'notes',
+        search_cols='body',
+        query='basil',
+        snip_col=1,
+        hl_col=1,
+    )
+
+    assert len(rows) == 1
+    assert '<b><mark>basil</mark></b>' in rows[0]['snippet']
+    assert rows[0]['highlight'] == 'tomato soup with <b><mark>basil</mark></b>'
+
+def test_fts_raw_select(connection):
+    rows = FTSAccessor().raw_select(
+        connection,
+        'SELECT name FROM notes_fts_unicode61 WHERE kind = :kind',
+        bind_params={'kind': 'recipe'},
+    )
+
+    assert sorted(row['name'] for row in rows) == ['n2', 'n3']
+
+def test_fts_missing_table(connection):
+    with pytest.raises(ValueError):
+        FTSAccessor().select(connection, 'missing', search_cols='body', query='tomato')
+
+def _source_engine():
+    engine = sa.create_engine('sqlite://')
+
+    with engine.connect() as connection:
+        connection.execute(sa.text(
+            'CREATE TABLE docs (id INTEGER PRIMARY KEY, name TEXT, body TEXT)'
+        ))
+        connection.execute(
+            sa.text('INSERT INTO docs (name, body) VALUES (:name, :body)'),
+            [
+                {'name': 'd1', 'body': 'tomatoes ripening on the vine'},
+                {'name': 'd2', 'body': 'a bowl of cucumbers'},
+            ]
+        )
+        connection.commit()
+
+    return engine
+
+def _match_names(engine, fts_table_name, query):
+    with engine.connect() as connection:
+        rows = connection.execute(
+            sa.text(f'SELECT name FROM {fts_table_name} WHERE {fts_table_name} MATCH :q'),
+            {'q': query},
+        )
+        return sorted(row.name for row in rows)
+
+def test_fts_populate_from_source():
+    engine = _source_engine()
+    util.db.populate_fts5(engine, ['search'], columns=['name', 'body'], source='docs')
+
+    assert _match_names(engine, 'search_fts_unicode61', 'cucumbers') == ['d2']
+    assert _match_names(engine, 'search_fts_porter', 'ripen') == ['d1']
+    assert _match_names(engine, 'search_fts_trigram', 'mato') == ['d1']
+
+def test_fts_populate_external_content():
+    engine = _source_engine()
+    util.db.populate_fts5(
+        engine,
+        ['search'],
+        columns=['name', 'body'],
+        source='docs',
+        external_content=True,
+    )
+
+    assert _match_names(engine, 'search_fts_unicode61', 'cucumbers') == ['d2']
+    assert _match_names(engine, 'search_fts_porter', 'ripen') == ['d1']
+
+def test_fts_populate_inserts():
+    engine = sa.create_engine('sqlite://')
+    inserts = (
+        {'name': f'g{i}', 'body': body}
+        for i, body in enumerate(['red tomato', 'green tomato', 'cucumber'])
+    )
+
+    # a one-shot generator is only consumed by the first tokenizer's table
+    util.db.populate_fts5(engine, ['gen'], columns=['name', 'body'], inserts=inserts)
+
+    for tokenizer in util.db.FTS5_TOKENIZERS:
+        assert _match_names(engine, f'gen_fts_{tokenizer}', 'tomato') == ['g0', 'g1']
+
+def test_fts_manager_recreate_from_table():
+    engine = _source_engine()
+    manager = FTSManager()
+
+    manager.recreate_from_table(engine, 'docs', cols=['name', 'body'])
+    assert _match_names(engine, 'search_fts_unicode61', 'vine') == ['d1']
+
+    with engine.connect() as connection:
+        manager.insert(connection, 'search', [{'name': 'd3', 'body': 'vine cuttings'}])
+        connection.commit()
+
+    for tokenizer in util.db.FTS5_TOKENIZERS:
+        assert _match_names(engine, f'search_fts_{tokenizer}', 'vine') == ['d1', 'd3']
+
+    manager.recreate_from_table(
+        engine, 'docs', cols=['name', 'body'], external_content=True
+    )
+    assert _match_names(engine, 'search_fts_unicode61', 'vine') == ['d1']
+
+def test_fts_manager_recreate():
+    metadata = sa.MetaData()
+    sa.Table(
+        'docs',
+        metadata,
+        sa.Column('id',   sa.Integer, primary_key=True),
+        sa.Column('name', sa.String),
+        sa.Column('body', sa.String),
+    )
+    schema = SQLSchema.from_metadata(metadata)
+
+    engine = SQLEngine('sqlite://')
+    metadata.create_all(engine.manager)
+    with engine.connect() as connection:
+        connection.execute(
+            sa.text('INSERT INTO docs (name, body) VALUES (:name, :body)'),
+            [{'name': 'd1', 'body': 'tomato vine'}],
+        )
+        connection.commit()
+
+    FTSManager().recreate(schema, engine)
+
+    assert _match_names(engine.manager, 'docs_fts_porter', 'vines') == ['d1']
+
+def test_fts_verified_tables():
+    accessor = FTSAccessor()
+    engine = sa.create_engine('sqlite://')
+
+    with engine.connect() as connection:
+        connection.execute(sa.text('CREATE VIRTUAL TABLE t_fts_unicode61 USING fts5(body)'))
+        accessor.select(connection, 't', search_cols='body', query='tomato')
+
+        assert accessor._verified_tables[engine] == {'t_fts_unicode61'}
+
+        # a table dropped after verification is forgotten on the failed search, and
+        # reported as missing on the next one
+        connection.execute(sa.text('DROP TABLE t_fts_unicode61'))
+        with pytest.raises(sqlite3.OperationalError):
+            accessor.select(connection, 't', search_cols='body', query='tomato')
+        with pytest.raises(ValueError):
+            accessor.select(connection, 't', search_cols='body', query='tomato')
+
+    # verified tables are held per engine, and released with it
+    del connection, engine
+    gc.collect()
+
+    assert len(accessor._verified_tables) == 0
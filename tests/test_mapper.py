@@ -32,6 +32,21 @@ def test_mapper_attach_many():
         lambda t: f'{t.__name__.lower()}'
     ) is None
 
+def test_mapper_attach_many_mappings():
+    assert veg.vegetable_mapper.attach_many(
+        veg.type_list,
+        {t: t.__name__.lower() for t in veg.type_list},
+        {
+            (t, g): f'{t.__name__.lower()}_{g}_states'
+            for t in veg.type_list
+            for g in t.group_registry
+        },
+    ) is None
+
+    tom_aging = veg.vegetable_schema.get_component('tomato_aging_states')
+
+    assert veg.vegetable_mapper.get_coll_comp(veg.Tomato, 'aging') is tom_aging
+
 def test_mapper_collect():
     tomato = veg.Tomato('t1', 10)
     receipts = veg.vegetable_mapper.collect(tomato)
@@ -54,3 +69,140 @@ def test_mapper_collect():
     assert len(res2) == 1
     assert len(res2[next(iter(res2.keys()))]) == 1
 
+
+def test_mapper_collect_batch():
+    tomato = veg.Tomato('t2', 10)
+    collector = veg.vegetable_mapper.collector
+
+    with collector.batch() as batch_receipt:
+        receipts = veg.vegetable_mapper.collect(tomato)
+
+    assert receipts == [batch_receipt] # single receipt for the whole batch
+
+    res = collector.collect_inserts(receipts)
+
+    assert len(res) == 2 # both components staged under the one receipt
+    assert collector.collect_inserts(receipts) == {}
+
+def test_mapper_collect_components():
+    class Basket(veg.CO3):
+        def __init__(self, *items):
+            super().__init__()
+            self.items = items
+
+        @property
+        def components(self):
+            return list(self.items)
+
+    # Basket isn't attached, but its components still collect under the given keys
+    basket = Basket(veg.Tomato('t3', 10))
+    receipts = veg.vegetable_mapper.collect(basket, keys=['ripe'])
+
+    res = veg.vegetable_mapper.collector.collect_inserts(receipts)
+    tom_aging = veg.vegetable_schema.get_component('tomato_aging_states')
+
+    assert len(res) == 3
+    assert len(res[tom_aging]) == 1
+
+def test_mapper_compose_cache():
+    agg_table = veg.vegetable_mapper.compose(veg.Tomato, ['aging'])
+
+    assert veg.vegetable_mapper.compose(veg.Tomato, ['aging']) is agg_table
+    assert veg.vegetable_mapper.compose(veg.Tomato) is not agg_table
+
+def test_mapper_collect_many():
+    tomatoes = [veg.Tomato(f'm{i}', i) for i in range(3)]
+    receipts = veg.vegetable_mapper.collect_many(tomatoes)
+
+    assert len(receipts) == 1
+
+    res = veg.vegetable_mapper.collector.collect_inserts(receipts)
+    tom_comp = veg.vegetable_mapper.get_attr_comp(veg.Tomato)
+
+    assert len(res) == 2
+    assert len(res[tom_comp]) == 3
+
+def test_mapper_collect_shared_components():
+    class Basket(veg.CO3):
+        def __init__(self, *items):
+            super().__init__()
+            self.items = list(items)
+
+        @property
+        def components(self):
+            return self.items
+
+    # shared and cyclic references are only collected once
+    tomato = veg.Tomato('t4', 10)
+    inner = Basket(tomato)
+    outer = Basket(tomato, inner)
+    inner.items.append(outer)
+
+    receipts = veg.vegetable_mapper.collect(outer)
+
+    res = veg.vegetable_mapper.collector.collect_inserts(receipts)
+    tom_comp = veg.vegetable_mapper.get_attr_comp(veg.Tomato)
+
+    assert len(res[tom_comp]) == 1
+
+def test_mapper_collect_repeated_attribute():
+    class Pair(veg.CO3):
+        def __init__(self, left, right):
+            super().__init__()
+            self.left = left
+            self.right = right
+
+        @property
+        def components(self):
+            return [self.left, self.right]
+
+    # one object held by two attributes stages a single set of inserts, while an equal
+    # but distinct object is still collected on its own
+    tomato = veg.Tomato('t5', 10)
+
+    receipts = veg.vegetable_mapper.collect(Pair(tomato, tomato), ['ripe'])
+    res = veg.vegetable_mapper.collector.collect_inserts(receipts)
+    tom_comp = veg.vegetable_mapper.get_attr_comp(veg.Tomato)
+
+    assert len(res[tom_comp]) == 1
+
+    receipts = veg.vegetable_mapper.collect(
+        Pair(tomato, veg.Tomato('t5', 10)), ['ripe']
+    )
+    res = veg.vegetable_mapper.collector.collect_inserts(receipts)
+
+    assert len(res[tom_comp]) == 2
+
+def test_mapper_collation_plan():
+    plan = veg.vegetable_mapper._collation_plan(veg.Tomato, ['ripe', 'cut'], None)
+
+    # 'cut' has no collation component attached, so it isn't collated at all
+    assert plan == (('ripe', (('aging',),)),)
+
+def test_mapper_collector_add_inserts():
+    collector = veg.vegetable_mapper.collector
+    tom_comp = veg.vegetable_mapper.get_attr_comp(veg.Tomato)
+
+    receipts = []
+    receipt = collector.add_inserts(
+        tom_comp,
+        [{'name': f'a{i}', 'radius': i} for i in range(3)],
+        receipts=receipts,
+    )
+
+    assert receipts == [receipt]
+
+    res = collector.collect_inserts(receipts)
+
+    assert len(res[tom_comp]) == 3
+
+def test_mapper_compose_unhashable_kwargs():
+    # unhashable compose kwargs bypass the cache rather than raising
+    agg_table = veg.vegetable_mapper.compose(
+        veg.Tomato, ['aging'], compose_kwargs={'outer': [1]}
+    )
+
+    assert agg_table is not None
+    assert veg.vegetable_mapper.compose(
+        veg.Tomato, ['aging'], compose_kwargs={'outer': [1]}
+    ) is not agg_table
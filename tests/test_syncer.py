@@ -0,0 +1,90 @@
+from types import SimpleNamespace
+
+import pytest
+
+from co3 import Differ, Syncer
+from co3 import syncer as syncer_module
+
+
+class ListResource:
+    def __init__(self, items):
+        self.items = items
+
+    def select(self, **kwargs):
+        return self.items
+
+class IdentityDiffer(Differ[int]):
+    def l_transform(self, item):
+        return item
+
+    def r_transform(self, item):
+        return item
+
+class TimedSyncer(Syncer[int]):
+    '''
+    Syncer whose handlers advance a fake clock by a fixed cost per item, recording the
+    size of each processed chunk.
+    '''
+    def __init__(self, differ, clock, item_costs):
+        super().__init__(differ)
+
+        self.clock = clock
+        self.item_costs = item_costs
+        self.chunk_sizes = []
+
+    def handle_l_excl(self, key, val):
+        cost_idx = min(len(self.chunk_sizes), len(self.item_costs) - 1)
+        self.clock.now += self.item_costs[cost_idx]
+        return key
+
+    def process_chunk(self, handler_results):
+        self.chunk_sizes.append(len(handler_results))
+        return handler_results
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = SimpleNamespace(now=0.0)
+    monkeypatch.setattr(
+        syncer_module, 'time', SimpleNamespace(time=lambda: clock.now)
+    )
+    return clock
+
+def make_syncer(clock, n_items, item_costs):
+    differ = IdentityDiffer(ListResource(list(range(n_items))), ListResource([]))
+    return TimedSyncer(differ, clock, item_costs)
+
+def test_syncer_chunk_size_target(clock):
+    # 1s chunks at 0.125s/item should settle on chunks of 8 after the first
+    syncer = make_syncer(clock, 100, [0.125])
+    results = syncer.chunked_sync({}, {}, chunk_time=1)
+
+    assert sorted(results) == list(range(100))
+    assert syncer.chunk_sizes[0] == 1
+    assert set(syncer.chunk_sizes[1:-1]) == {8}
+    assert sum(syncer.chunk_sizes) == 100
+
+def test_syncer_chunk_size_converges(clock):
+    # items get cheaper after the third chunk; sizes grow smoothly toward 1/0.125 = 8
+    syncer = make_syncer(clock, 400, [0.25, 0.25, 0.25, 0.125])
+    syncer.chunked_sync({}, {}, chunk_time=1)
+
+    sizes = syncer.chunk_sizes[3:-1]
+
+    assert syncer.chunk_sizes[1:3] == [4, 4]
+    assert sizes == sorted(sizes)
+    assert sizes[0] < 7 <= sizes[-1] <= 8
+
+def test_syncer_chunk_cap_and_limit(clock):
+    syncer = make_syncer(clock, 100, [0.125])
+    results = syncer.chunked_sync({}, {}, chunk_time=1, chunk_cap=5, item_limit=23)
+
+    assert len(results) == 23
+    assert max(syncer.chunk_sizes) <= 5
+    assert syncer.chunk_sizes[1:-1] == [5] * (len(syncer.chunk_sizes) - 2)
+    assert sum(syncer.chunk_sizes) == 23
+
+def test_syncer_no_chunk_time(clock):
+    syncer = make_syncer(clock, 10, [0.125])
+    syncer.chunked_sync({}, {}, chunk_cap=4)
+
+    assert syncer.chunk_sizes == [4, 4, 2]
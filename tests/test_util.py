@@ -0,0 +1,114 @@
+import sqlalchemy as sa
+
+from co3 import util
+
+
+def test_util_bulk_insert():
+    engine = sa.create_engine('sqlite://')
+
+    metadata = sa.MetaData()
+    table = sa.Table(
+        'orders',
+        metadata,
+        sa.Column('id',       sa.Integer, primary_key=True),
+        sa.Column('order',    sa.String),
+        sa.Column('ItemName', sa.String),
+        sa.Column('qty',      sa.Integer, default=1),
+    )
+    metadata.create_all(engine)
+
+    # reserved-word and mixed-case columns, rows with differing keys
+    util.db.bulk_insert(engine, table, [
+        {'order': 'a', 'ItemName': 'apple', 'qty': 3},
+        {'order': 'b', 'ItemName': 'pear'},
+        {'ItemName': 'plum', 'qty': 2},
+    ])
+
+    with engine.connect() as connection:
+        rows = connection.execute(
+            sa.select(table.c.order, table.c.ItemName, table.c.qty).order_by(table.c.id)
+        ).all()
+
+    assert rows == [('a', 'apple', 3), ('b', 'pear', 1), (None, 'plum', 2)]
+
+def test_util_bulk_insert_defaults():
+    engine = sa.create_engine('sqlite://')
+
+    metadata = sa.MetaData()
+    table = sa.Table(
+        'stock',
+        metadata,
+        sa.Column('id',    sa.Integer, primary_key=True),
+        sa.Column('name',  sa.String),
+        sa.Column('shelf', sa.String,  server_default='back'),
+        sa.Column('code',  sa.String,  default=lambda: 'auto'),
+    )
+    metadata.create_all(engine)
+
+    # omitted server-defaulted columns are left to the database, and omitted columns
+    # with callable defaults are still filled by them
+    util.db.bulk_insert(engine, table, [
+        {'name': 'fig', 'shelf': 'front', 'code': 'f1'},
+        {'name': 'kiwi', 'code': 'k1'},
+        {'name': 'lime'},
+    ])
+
+    with engine.connect() as connection:
+        rows = connection.execute(
+            sa.select(table.c.name, table.c.shelf, table.c.code).order_by(table.c.id)
+        ).all()
+
+    assert rows == [('fig', 'front', 'f1'), ('kiwi', 'back', 'k1'), ('lime', 'back', 'auto')]
+
+def test_util_named_results():
+    engine = sa.create_engine('sqlite://')
+
+    metadata = sa.MetaData()
+    table = sa.Table(
+        'fruit',
+        metadata,
+        sa.Column('id',   sa.Integer, primary_key=True),
+        sa.Column('name', sa.String),
+    )
+    metadata.create_all(engine)
+
+    with engine.connect() as connection:
+        connection.execute(sa.insert(table), [{'name': 'fig'}, {'name': 'kiwi'}])
+
+        results = connection.execute(sa.select(table).order_by(table.c.id))
+        assert util.db.named_results(table, results) == [
+            {'id': 1, 'name': 'fig'},
+            {'id': 2, 'name': 'kiwi'},
+        ]
+
+        # rows are converted lazily as the streamed result is consumed
+        results = connection.execute(
+            sa.select(table).order_by(table.c.id),
+            execution_options={'yield_per': 1},
+        )
+        rows = util.db.iter_named_results(table, results)
+
+        assert next(rows) == {'id': 1, 'name': 'fig'}
+        assert list(rows) == [{'id': 2, 'name': 'kiwi'}]
+
+def test_util_nested_paths(tmp_path):
+    for dir_path in ['a/foo.tmp', 'a/bak~', '.hidden', 'b']:
+        (tmp_path / dir_path).mkdir(parents=True)
+
+    for file_path in [
+        'x.txt', 'x.tmp', 'x~', '.h', 'b/c.txt', 'b/c.tmp',
+        'a/foo.tmp/in.txt', 'a/foo.tmp/y.tmp', 'a/bak~/in.txt', '.hidden/z.txt',
+    ]:
+        (tmp_path / file_path).touch()
+
+    # should match the equivalent glob for every combination of options
+    for ext in ['', '.txt']:
+        for no_dir in [False, True]:
+            nested = util.paths.iter_nested_paths(
+                tmp_path, ext, no_dir=no_dir, relative=True
+            )
+            globbed = util.paths.iter_glob_paths(
+                f'**/!(.*|*.tmp|*~)*{ext}', tmp_path, no_dir=no_dir, relative=True
+            )
+
+            assert sorted(nested) == sorted(globbed)